@@ -11,14 +11,17 @@ from .command import Command, cmd, run
 from .fileio import (
     atomicdir,
     atomicfile,
+    atomicgroup,
     read,
     readbytes,
     readchunks,
     readlines,
+    readmmap,
     readtext,
     write,
     writebytes,
     writelines,
+    writemany,
     writetext,
 )
 from .filesystem import (
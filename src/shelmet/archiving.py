@@ -6,6 +6,7 @@ import errno
 import os
 from pathlib import Path, PurePath
 import tarfile
+import time
 from types import TracebackType
 import typing as t
 import zipfile
@@ -30,6 +31,9 @@ DEFAULT_TAR_FORMAT = tarfile.PAX_FORMAT
 # Use ZIP_DEFLATED as default zipfile compression if available.
 DEFAULT_ZIP_COMPRESSION = zipfile.ZIP_DEFLATED if zlib else zipfile.ZIP_STORED
 
+# Default timestamp format used in backup names.
+DEFAULT_BACKUP_TIMESTAMP = "%Y-%m-%dT%H:%M:%S.%f%z"
+
 # Archive names to exclude when adding to an archive.
 EXCLUDE_ARCNAMES = {".", ".."}
 
@@ -376,7 +380,7 @@ def archive(
 def backup(
     src: StrPath,
     *,
-    timestamp: t.Optional[str] = "%Y-%m-%dT%H:%M:%S.%f%z",
+    timestamp: t.Optional[str] = DEFAULT_BACKUP_TIMESTAMP,
     utc: bool = False,
     epoch: bool = False,
     prefix: str = "",
@@ -386,6 +390,7 @@ def backup(
     overwrite: bool = False,
     dir: t.Optional[StrPath] = None,
     namer: t.Optional[t.Callable[[Path], StrPath]] = None,
+    resolve: bool = False,
 ) -> Path:
     """
     Create a backup of a file or directory as either a direct copy or an archive file.
@@ -415,6 +420,10 @@ def backup(
     destination path of the backup. All other arguments to this function will be ignored except for
     `overwrite`.
 
+    If `resolve` is ``True``, then symlinks in the `src`, `dir`, and backup paths will be resolved
+    so that a symlinked `src` is backed up next to (and named after) its target. Otherwise, the
+    paths are only made absolute which avoids a filesystem lookup for each path component.
+
     Args:
         src: Source file or directory to backup.
         timestamp: Timestamp strftime-format string or ``None`` to exclude timestamp from backup
@@ -435,6 +444,7 @@ def backup(
         namer: Naming function that can be used to return the full path of the backup location. It
             will be passed the `src` value as a ``pathlib.Path`` object as a positional argument. It
             should return the destination path of the backup as a ``str`` or ``pathlib.Path``.
+        resolve: Whether to resolve symlinks in the `src`, `dir`, and backup paths.
 
     Returns:
         Backup location.
@@ -444,13 +454,13 @@ def backup(
             f"timestamp should be a strftime-formatted string or None, not {timestamp!r}"
         )
 
-    src = Path(src).resolve()
+    src = _backup_path(src, resolve=resolve)
 
     if ext:
         suffix = ext
 
     if namer:
-        dst = Path(namer(src)).resolve()
+        dst = _backup_path(namer(src), resolve=resolve)
     else:
         dst = _backup_namer(
             src,
@@ -461,6 +471,7 @@ def backup(
             suffix=suffix,
             hidden=hidden,
             dir=dir,
+            resolve=resolve,
         )
 
     if src == dst:
@@ -472,41 +483,59 @@ def backup(
     if ext:
         archive(dst, src, ext=ext)
     else:
-        cp(src, dst)
+        cp(src, dst, atomic=True)
 
     return dst
 
 
+def _backup_path(path: StrPath, *, resolve: bool = False) -> Path:
+    """Return absolute backup path with symlinks resolved if `resolve` is ``True``."""
+    # Only normalize the path unless symlinks should be resolved since os.path.abspath() doesn't
+    # touch the filesystem while resolve() looks up each path component.
+    if resolve:
+        return Path(path).resolve()
+    return Path(os.path.abspath(path))
+
+
 def _backup_namer(
     src: Path,
     *,
-    timestamp: t.Optional[str] = "%Y-%m-%dT%H:%M:%S.%f%z",
+    timestamp: t.Optional[str] = DEFAULT_BACKUP_TIMESTAMP,
     utc: bool = False,
     epoch: bool = False,
     prefix: str = "",
     suffix: str = "~",
     hidden: bool = False,
     dir: t.Optional[StrPath] = None,
+    resolve: bool = False,
 ) -> Path:
     if not dir:
-        dir = src.parent.resolve()
+        dir = src.parent
     else:
-        dir = Path(dir).resolve()
+        dir = _backup_path(dir, resolve=resolve)
 
     if hidden and not prefix.startswith("."):
         prefix = f".{prefix}"
 
-    ts: t.Union[str, float] = ""
+    ts = ""
     if timestamp is not None:
-        tz = None
-        if utc:
-            tz = timezone.utc
-        dt = datetime.now(tz)
-
         if epoch:
-            ts = dt.timestamp()
+            # Unix time doesn't depend on the timezone so there's no need for a datetime object.
+            ts = str(time.time())
         else:
-            ts = dt.strftime(timestamp)
+            tz = None
+            if utc:
+                tz = timezone.utc
+            dt = datetime.now(tz)
+
+            if timestamp == DEFAULT_BACKUP_TIMESTAMP:
+                # Produce the same string as strftime() with the default format using isoformat()
+                # which is much faster.
+                ts = dt.replace(tzinfo=None).isoformat(timespec="microseconds")
+                if tz:
+                    ts += "+0000"
+            else:
+                ts = dt.strftime(timestamp)
 
         ts = f".{ts}"
 
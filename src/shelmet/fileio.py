@@ -1,14 +1,28 @@
 """The fileio module contains utilities for file IO."""
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import contextvars
 import errno
 from functools import partial
 import io
+from itertools import islice
+import mmap
 import os
 from pathlib import Path
+import stat
 import typing as t
 
-from .filesystem import _candidate_temp_pathname, dirsync, fsync, mkdir, rm
+from .filesystem import (
+    _candidate_temp_pathname,
+    _mktempdir,
+    _mktempfile,
+    _stat_or_none,
+    dirsync,
+    fsync,
+    mkdir,
+    rm,
+)
 from .types import (
     READ_ONLY_MODES,
     WRITE_ONLY_BIN_MODES,
@@ -22,7 +36,21 @@ from .types import (
 )
 
 
-DEFAULT_CHUNK_SIZE = io.DEFAULT_BUFFER_SIZE
+# Read at least 128 KB at a time since smaller reads spend more time on per-call overhead than on
+# copying data.
+DEFAULT_CHUNK_SIZE = max(io.DEFAULT_BUFFER_SIZE, 128 * 1024)
+
+# Min size of binary contents that write() writes without a write buffer.
+WRITE_UNBUFFERED_MIN_SIZE = 1024 * 1024
+
+# Number of items that writelines() joins into each write so that memory use is bounded by a batch
+# of items instead of all of them.
+WRITELINES_BATCH_SIZE = 1024
+
+# Parent directories of atomic writes whose dirsync has been deferred by an active atomicgroup().
+_pending_dirsyncs: "contextvars.ContextVar[t.Optional[t.Set[str]]]" = contextvars.ContextVar(
+    "_pending_dirsyncs", default=None
+)
 
 
 @contextmanager
@@ -44,12 +72,14 @@ def atomicdir(dir: StrPath, *, skip_sync: bool = False, overwrite: bool = True)
         overwrite: Whether to raise an exception if the destination exists once the directory is to
             be moved to its destination.
     """
-    dst = Path(dir).absolute()
-    if dst.is_file():
+    dst = os.path.abspath(dir)
+    dst_stat = _stat_or_none(dst)
+    if dst_stat and stat.S_ISREG(dst_stat.st_mode):
         raise FileExistsError(errno.EEXIST, f"Atomic directory target must not be a file: {dst}")
 
-    tmp_dir = _candidate_temp_pathname(path=dst, prefix="_", suffix="_tmp")
-    mkdir(tmp_dir)
+    mkdir(os.path.dirname(dst))
+    tmp_dir = _mktempdir(path=dst, prefix="_", suffix="_tmp")
+    published = False
 
     try:
         yield Path(tmp_dir)
@@ -58,20 +88,50 @@ def atomicdir(dir: StrPath, *, skip_sync: bool = False, overwrite: bool = True)
             dirsync(tmp_dir)
 
         if overwrite:
-            rm(dst)
-        elif dst.exists():
+            old_dst = _replacedir(tmp_dir, dst)
+            published = True
+            if old_dst:
+                rm(old_dst)
+        elif os.path.exists(dst):
             raise FileExistsError(
                 errno.EEXIST,
                 f"Atomic directory target must not exist when overwrite disabled: {dst}",
             )
-
-        os.rename(tmp_dir, dst)
+        else:
+            os.rename(tmp_dir, dst)
+            published = True
 
         if not skip_sync:
-            dirsync(dst)
+            _dirsync_or_defer(os.path.dirname(dst))
     finally:
-        # In case something went wrong that prevented moving tmp_dir to dst.
-        rm(tmp_dir)
+        if not published:
+            # In case something went wrong that prevented moving tmp_dir to dst.
+            rm(tmp_dir)
+
+
+def _replacedir(src: str, dst: str) -> t.Optional[str]:
+    """
+    Replace `dst` with directory `src` and return the path that an existing `dst` was moved to (if
+    any) so that it can be removed after the new directory is in place.
+    """
+    try:
+        os.replace(src, dst)
+        return None
+    except OSError as exc:
+        if exc.errno not in (errno.ENOTEMPTY, errno.EEXIST, errno.ENOTDIR):
+            raise
+
+    # A directory can only replace an empty directory so the existing destination is moved out of
+    # the way first. This keeps the time that dst doesn't exist as short as two renames instead of
+    # as long as it takes to delete it.
+    old_dst = _candidate_temp_pathname(path=dst, prefix="_", suffix="_old")
+    os.rename(dst, old_dst)
+    try:
+        os.rename(src, dst)
+    except OSError:  # pragma: no cover
+        os.rename(old_dst, dst)
+        raise
+    return old_dst
 
 
 @contextmanager
@@ -91,7 +151,7 @@ def atomicfile(
     This context-manager will open a temporary file for writing in the same directory as the
     destination and yield a file object just like ``open()`` does. All file operations while the
     context-manager is opened will be performed on the temporary file. Once the context-manager
-    exits, the temporary file will flushed and fsync'd (unless ``skip_sync=True``). If the
+    exits, the temporary file will flushed and fdatasync'd (unless ``skip_sync=True``). If the
     destination file exists, it will be overwritten unless ``overwrite=False``.
 
     Args:
@@ -112,31 +172,98 @@ def atomicfile(
     if not isinstance(mode, str) or "w" not in mode:
         raise ValueError(f"Invalid atomic write mode: {mode}")
 
-    dst = Path(file).absolute()
-    if dst.is_dir():
+    dst = os.path.abspath(file)
+    dst_stat = _stat_or_none(dst)
+    if dst_stat and stat.S_ISDIR(dst_stat.st_mode):
         raise IsADirectoryError(errno.EISDIR, f"Atomic file target must not be a directory: {dst}")
 
-    mkdir(dst.parent)
-    tmp_file = _candidate_temp_pathname(path=dst, prefix="_", suffix=".tmp")
+    dst_parent = os.path.dirname(dst)
+    mkdir(dst_parent)
+    tmp_fd, tmp_file = _mktempfile(path=dst, prefix="_", suffix=".tmp")
+    published = False
 
     try:
-        with open(tmp_file, mode, **open_kwargs) as fp:
+        with _openfd(tmp_fd, tmp_file, mode, **open_kwargs) as fp:
             yield fp
             if not skip_sync:
-                fsync(fp)
+                # Only the file data needs to be synced since the directory entry is synced
+                # separately after the file is moved to its destination.
+                fsync(fp, data_only=True)
 
         if overwrite:
-            os.rename(tmp_file, dst)
+            os.replace(tmp_file, dst)
         else:
             # This will fail if dst exists.
             os.link(tmp_file, dst)
             rm(tmp_file)
+        published = True
 
         if not skip_sync:
-            dirsync(dst.parent)
+            _dirsync_or_defer(dst_parent)
+    finally:
+        if not published:
+            # In case something went wrong that prevented moving tmp_file to dst.
+            rm(tmp_file)
+
+
+def _openfd(fd: int, file: str, mode: str, **open_kwargs: t.Any) -> t.IO:
+    """Return file object for an already open file descriptor that is named after `file`."""
+    opened = False
+
+    def opener(_file: str, _flags: int) -> int:
+        nonlocal opened
+        opened = True
+        return fd
+
+    try:
+        return open(file, mode, opener=opener, **open_kwargs)
+    except BaseException:
+        # Once the opener is called, the file descriptor is owned (and closed) by the file object.
+        if not opened:
+            os.close(fd)
+        raise
+
+
+@contextmanager
+def atomicgroup() -> t.Iterator[None]:
+    """
+    Context-manager that defers the directory syncs of :func:`atomicfile` and :func:`atomicdir`
+    until it exits.
+
+    Normally, each :func:`atomicfile` and :func:`atomicdir` will call :func:`dirsync` on the
+    destination's parent directory after the temporary path is moved to its destination. While this
+    context-manager is active, those directory syncs are collected instead and each unique parent
+    directory is synced once on exit. This can greatly reduce the number of directory syncs when
+    writing many files or directories to the same directory.
+
+    Warning:
+        The contents are still synced by each :func:`atomicfile` or :func:`atomicdir`, but the
+        renames that make them visible at their destinations are not made durable until the group
+        exits. If the system crashes before then, those paths may be missing after recovery.
+
+    Nested groups are merged into the outermost group.
+    """
+    if _pending_dirsyncs.get() is not None:
+        yield
+        return
+
+    pending_dirsyncs: t.Set[str] = set()
+    token = _pending_dirsyncs.set(pending_dirsyncs)
+
+    try:
+        yield
     finally:
-        # In case something went wrong that prevented moving tmp_file to dst.
-        rm(tmp_file)
+        _pending_dirsyncs.reset(token)
+        for dir in sorted(pending_dirsyncs):
+            dirsync(dir)
+
+
+def _dirsync_or_defer(dir: str) -> None:
+    pending_dirsyncs = _pending_dirsyncs.get()
+    if pending_dirsyncs is None:
+        dirsync(dir)
+    else:
+        pending_dirsyncs.add(dir)
 
 
 @t.overload
@@ -166,6 +293,11 @@ def read(file: StrPath, mode: str = "r", **open_kwargs: t.Any) -> t.Union[str, b
     if mode not in READ_ONLY_MODES:
         raise ValueError(f"Invalid read-only mode: {mode}")
 
+    if "b" in mode:
+        # Reading the whole file doesn't benefit from a read buffer so use the raw file object
+        # directly which will read the file into a single pre-sized bytes object.
+        open_kwargs.setdefault("buffering", 0)
+
     with open(file, mode, **open_kwargs) as fp:
         return fp.read()
 
@@ -183,6 +315,35 @@ def readbytes(file: StrPath, **open_kwargs: t.Any) -> bytes:
     return read(file, "rb", **open_kwargs)
 
 
+def readmmap(file: StrPath) -> mmap.mmap:
+    """
+    Return read-only memory-map of file's contents.
+
+    The memory-map supports the buffer protocol so its contents can be sliced, searched, or passed
+    to functions that accept ``bytes``-like objects without first copying the whole file into
+    memory. The kernel is advised that the contents will be accessed sequentially (when supported)
+    so that pages are read ahead more aggressively.
+
+    Note:
+        The returned memory-map should be closed when no longer needed (e.g. by using it as a
+        context-manager).
+
+    Args:
+        file: File to read.
+
+    Raises:
+        ValueError: If the file is empty since empty files can't be memory-mapped.
+    """
+    with open(file, "rb", buffering=0) as fp:
+        # The memory-map keeps its own reference to the file so it can outlive the file object.
+        mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if hasattr(mmap, "MADV_SEQUENTIAL"):  # pragma: no cover
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    return mm
+
+
 def readtext(file: StrPath, **open_kwargs: t.Any) -> str:
     """
     Return text contents of file.
@@ -268,30 +429,97 @@ def _readchunks(file, mode="r", *, size=DEFAULT_CHUNK_SIZE, sep=None, **open_kwa
         buffer = b""
 
     with open(file, mode, **open_kwargs) as fp:
+        _advisesequential(fp)
+        # Bind the read method once since it's called for every chunk.
+        fp_read = fp.read
         try:
-            while True:
-                chunk = fp.read(size)
-
-                if not chunk:
-                    # We're done with the file but if we have anything in the buffer, yield it.
-                    if buffer:
-                        yield buffer
-                    break
-                elif not sep:
-                    # Yield chunks delineated by size.
-                    yield chunk
-                else:
-                    buffer += chunk
-                    # Yield chunks delineated by separator.
-                    while sep in buffer:
-                        chunk, buffer = buffer.split(sep, 1)
-                        yield chunk
-
+            if not sep:
+                # Yield chunks delineated by size.
+                yield from iter(partial(fp_read, size), buffer)
+            elif isinstance(sep, bytes):
+                yield from _splitchunks(fp_read, size, sep)
+            else:
+                yield from _splittextchunks(fp_read, size, sep)
         except GeneratorExit:  # pragma: no cover
             # Catch GeneratorExit to ensure contextmanager closes file when exiting generator early.
             pass
 
 
+def _advisesequential(fp: t.IO) -> None:
+    """Advise the kernel that the file will be read sequentially so that it reads ahead further."""
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover
+        return
+
+    try:
+        os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:  # pragma: no cover
+        # Advice isn't supported for all file types (e.g. pipes).
+        pass
+
+
+def _splitchunks(
+    fp_read: t.Callable[[int], bytes], size: int, sep: bytes
+) -> t.Generator[bytes, None, None]:
+    """Yield binary chunks split by separator from successive reads of `size`."""
+    buffer = bytearray()
+    sep_len = len(sep)
+    # Position to resume the separator search from so that buffered contents already known to not
+    # contain the separator aren't scanned again after each read.
+    pos = 0
+
+    while True:
+        chunk = fp_read(size)
+
+        if not chunk:
+            if buffer:
+                yield bytes(buffer)
+            break
+
+        buffer += chunk
+
+        while True:
+            idx = buffer.find(sep, pos)
+            if idx < 0:
+                # A separator could straddle this read and the next so back up by its length.
+                pos = max(0, len(buffer) - sep_len + 1)
+                break
+            yield bytes(buffer[:idx])
+            del buffer[: idx + sep_len]
+            pos = 0
+
+
+def _splittextchunks(
+    fp_read: t.Callable[[int], str], size: int, sep: str
+) -> t.Generator[str, None, None]:
+    """Yield text chunks split by separator from successive reads of `size`."""
+    # Reads that don't contain the separator are collected and only joined once a separator is found
+    # so that contents aren't repeatedly copied into an ever growing string.
+    pending: t.List[str] = []
+    tail_len = len(sep) - 1
+    # End of the pending contents that a separator could start in and finish in the next read.
+    tail = ""
+
+    while True:
+        chunk = fp_read(size)
+
+        if not chunk:
+            # We're done with the file but if we have anything pending, yield it.
+            if pending:
+                yield "".join(pending)
+            break
+
+        pending.append(chunk)
+        window = tail + chunk
+
+        if sep in window:
+            *chunks, rest = "".join(pending).split(sep)
+            yield from chunks
+            pending = [rest] if rest else []
+            window = rest
+
+        tail = window[-tail_len:] if tail_len else ""
+
+
 @t.overload
 def readlines(
     file: StrPath, mode: ReadOnlyTextMode, *, limit: int = ..., **open_kwargs: t.Any
@@ -340,8 +568,9 @@ def _readlines(file, mode="r", *, limit=-1, **open_kwargs):
         sentinel = b""
 
     with open(file, mode, **open_kwargs) as fp:
+        _advisesequential(fp)
         try:
-            yield from iter(lambda: fp.readline(limit), sentinel)
+            yield from iter(partial(fp.readline, limit), sentinel)
         except GeneratorExit:  # pragma: no cover
             # Catch GeneratorExit to ensure contextmanager closes file when exiting generator early.
             pass
@@ -411,8 +640,40 @@ def write(
         mode = mode.replace("x", "w")
         opener = partial(atomicfile, overwrite=overwrite)  # type: ignore
 
+    if "b" in mode and len(contents) >= WRITE_UNBUFFERED_MIN_SIZE:
+        # Large contents don't benefit from a write buffer so write them straight to the raw file
+        # object.
+        open_kwargs.setdefault("buffering", 0)
+
     with opener(file, mode, **open_kwargs) as fp:
-        fp.write(contents)
+        if isinstance(contents, str) and isinstance(fp, io.TextIOWrapper) and "a" not in mode:
+            _write_encoded(fp, contents, newline=open_kwargs.get("newline"))
+        elif isinstance(fp, io.RawIOBase):
+            _writeall(fp, contents)  # type: ignore
+        else:
+            fp.write(contents)
+
+
+def _writeall(fp: io.RawIOBase, contents: bytes) -> None:
+    """Write all contents to raw file object which may write less than given in a single call."""
+    with memoryview(contents) as view:
+        written = 0
+        while written < len(view):
+            written += fp.write(view[written:])  # type: ignore
+
+
+def _write_encoded(fp: io.TextIOWrapper, contents: str, newline: t.Optional[str] = None) -> None:
+    """
+    Write text contents to the binary buffer underlying a text file object.
+
+    The contents are encoded in a single pass which bypasses the text layer's chunked encoding.
+    """
+    if newline is None:
+        newline = os.linesep
+    if newline not in ("", "\n"):
+        contents = contents.replace("\n", newline)
+    fp.flush()
+    fp.buffer.write(contents.encode(fp.encoding, fp.errors or "strict"))
 
 
 def writetext(
@@ -453,6 +714,54 @@ def writebytes(
     write(file, contents, mode, atomic=atomic, **open_kwargs)
 
 
+def writemany(
+    items: t.Iterable[t.Tuple[StrPath, t.Union[str, bytes]]],
+    mode: str = "w",
+    *,
+    atomic: bool = False,
+    workers: t.Optional[int] = None,
+    **open_kwargs: t.Any,
+) -> None:
+    """
+    Write contents to many files concurrently.
+
+    Each file is written with :func:`write` from a thread pool. Since file IO releases the GIL, the
+    writes (and their ``fsync`` calls when ``atomic=True``) can overlap with each other. Atomic
+    writes are grouped with :func:`atomicgroup` so that each parent directory is synced once after
+    all files have been written.
+
+    Args:
+        items: Iterable of ``(file, contents)`` pairs to write.
+        mode: File open mode.
+        atomic: Whether to write each file to a temporary location in the same directory before
+            moving it to the destination.
+        workers: Maximum number of threads to write with. Defaults to the default used by
+            ``concurrent.futures.ThreadPoolExecutor``.
+        **open_kwargs: Additional keyword arguments to pass to ``open``.
+    """
+    if mode not in WRITE_ONLY_MODES:
+        raise ValueError(f"Invalid write-only mode: {mode}")
+
+    with atomicgroup(), ThreadPoolExecutor(max_workers=workers) as executor:
+        # Each write runs in a copy of the current context so that the active atomicgroup is
+        # visible from the worker threads.
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                write,
+                file,
+                contents,
+                mode,
+                atomic=atomic,
+                **open_kwargs,
+            )
+            for file, contents in items
+        ]
+
+    for future in futures:
+        future.result()
+
+
 @t.overload
 def writelines(
     file: StrPath,
@@ -527,6 +836,13 @@ def writelines(
         mode = mode.replace("x", "w")
         opener = partial(atomicfile, overwrite=overwrite)  # type: ignore
 
-    lines = (item + ending for item in items)  # type: ignore
     with opener(file, mode, **open_kwargs) as fp:
-        fp.writelines(lines)
+        # Join items in batches so that there's one write per batch instead of one per line without
+        # joining everything into a single large object.
+        fp_write = fp.write
+        iter_items = iter(items)
+        while True:
+            batch = list(islice(iter_items, WRITELINES_BATCH_SIZE))
+            if not batch:
+                break
+            fp_write(ending.join(batch) + ending)  # type: ignore
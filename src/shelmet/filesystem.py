@@ -1,15 +1,16 @@
 """The filesystem module contains utilities for interacting with the file system."""
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import errno
+from functools import lru_cache, partial
 import itertools
 import os
 from pathlib import Path
-import random
 import re
+import secrets
 import shutil
 import stat
-import string
 import typing as t
 
 from .path import walk
@@ -21,6 +22,10 @@ try:
 except ImportError:  # pragma: no cover
     fcntl = None  # type: ignore
 
+# Checked once since fsync() is called for every atomic write.
+_HAS_FULLFSYNC = hasattr(fcntl, "F_FULLFSYNC")
+_HAS_FDATASYNC = hasattr(os, "fdatasync")
+
 
 try:
     from pwd import getpwnam
@@ -34,6 +39,27 @@ except ImportError:  # pragma: no cover
     getgrnam = None  # type: ignore
 
 
+# Max bytes to request per os.copy_file_range() call (the kernel may copy less per call).
+_COPY_FILE_RANGE_MAX_COUNT = 2**30
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.ETXTBSY,
+}
+
+
+# Errors from syncing a directory on filesystems that don't support it (e.g. some network and FUSE
+# mounts). Devices that raise them are remembered so that later syncs on them are skipped.
+_DIRSYNC_UNSUPPORTED_ERRNOS = frozenset({errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP})
+_dirsync_unsupported_devices: t.Set[int] = set()
+
+# Whether directory trees can be walked with directory file descriptors that the recursive chmod()
+# and chown() can operate relative to instead of re-resolving each full path.
+_WALKAT_SUPPORTED = hasattr(os, "fwalk") and {os.stat, os.chmod, os.chown} <= os.supports_dir_fd
+
 CHMOD_SYMBOLIC_PATTERN = re.compile(r"^(?P<who>[ugoa]*)(?P<op>[+\-=])(?P<perm>[ugo]|[rwxst]*)$")
 CHMOD_SYMBOLIC_TABLE: t.Dict[str, int] = {
     "ur": stat.S_IRUSR,
@@ -56,6 +82,20 @@ CHMOD_SYMBOLIC_TABLE: t.Dict[str, int] = {
     "g": stat.S_IRWXG | stat.S_ISGID,
     "o": stat.S_IRWXO | stat.S_ISVTX,
 }
+# Precomputed from CHMOD_SYMBOLIC_TABLE: All permission bits of each user class and the pairs of
+# (from_bit, to_bit) that are copied when a user class inherits permissions from another.
+CHMOD_SYMBOLIC_WHO_MASKS: t.Dict[str, int] = {
+    who: sum(CHMOD_SYMBOLIC_TABLE.get(who + perm, 0) for perm in "rwxst") for who in "ugoa"
+}
+CHMOD_SYMBOLIC_INHERIT_TABLE: t.Dict[t.Tuple[str, str], t.Tuple[t.Tuple[int, int], ...]] = {
+    (to_who, from_who): tuple(
+        (CHMOD_SYMBOLIC_TABLE[from_who + perm], CHMOD_SYMBOLIC_TABLE[to_who + perm])
+        for perm in "rwxst"
+        if from_who + perm in CHMOD_SYMBOLIC_TABLE and to_who + perm in CHMOD_SYMBOLIC_TABLE
+    )
+    for to_who in "ugoa"
+    for from_who in "ugo"
+}
 
 
 def chmod(
@@ -133,9 +173,6 @@ def chmod(
         follow_symlinks: Whether to follow symlinks.
         recursive: Whether to recursively apply permissions to subdirectories and their files.
     """
-    if not isinstance(path, int):
-        path = Path(path)
-
     if isinstance(mode, str):
         # Attempt to convert mode from octal string to integer to support values like "640".
         try:
@@ -149,23 +186,60 @@ def chmod(
 
     if isinstance(mode, str):
         # Process mode as symbolic permissions like "ug=rw,o=r".
-        if isinstance(path, int):
-            path_stat = os.stat(path)
-        else:
-            path_stat = path.stat()
-        mode = _get_symbolic_mode(path_stat.st_mode, mode)
+        mode = _get_symbolic_mode(os.stat(path).st_mode, mode)
 
     os.chmod(path, mode, follow_symlinks=follow_symlinks)
 
-    if recursive and isinstance(path, Path) and path.is_dir():
-        for subpath in walk(path):
-            # Disable recursive option so we can handle all sub-paths from here instead of using
-            # recursive function calls.
-            chmod(subpath, original_mode, follow_symlinks=follow_symlinks, recursive=False)
+    if recursive and not isinstance(path, int) and os.path.isdir(path):
+        if not _WALKAT_SUPPORTED:  # pragma: no cover
+            for subpath in walk(path):
+                # Disable recursive option so we can handle all sub-paths from here instead of using
+                # recursive function calls.
+                chmod(subpath, original_mode, follow_symlinks=follow_symlinks, recursive=False)
+            return
+
+        # Bind what's used for every entry once since trees can have many entries.
+        is_symbolic = isinstance(original_mode, str)
+        os_stat = os.stat
+        os_chmod = os.chmod
+        for name, dir_fd in _walkat(path):
+            if is_symbolic:
+                mode = _get_symbolic_mode(os_stat(name, dir_fd=dir_fd).st_mode, original_mode)
+            os_chmod(name, mode, dir_fd=dir_fd, follow_symlinks=follow_symlinks)
 
 
 def _get_symbolic_mode(base_mode: int, symbolic_mode: str) -> int:
     """Return integer mode from a symbolic mode."""
+    masks = _get_symbolic_mode_masks(symbolic_mode)
+    if masks is None:
+        return _parse_symbolic_mode(base_mode, symbolic_mode)
+    keep_mask, set_mask = masks
+    return (base_mode & keep_mask) | set_mask
+
+
+@lru_cache(maxsize=256)
+def _get_symbolic_mode_masks(symbolic_mode: str) -> t.Optional[t.Tuple[int, int]]:
+    """
+    Return masks of the bits kept from and set on any base mode by a symbolic mode.
+
+    ``None`` is returned if the symbolic mode inherits permissions from the base mode.
+    """
+    # NOTE: Unless permissions are inherited from a user class, each mode bit is either kept, set,
+    # or cleared regardless of the base mode. Applying the symbolic mode to a base mode with all
+    # bits set and one with no bits set gives masks that can then be applied to any base mode so
+    # that the parsing is only done once per symbolic mode.
+    for item in symbolic_mode.split(","):
+        match = CHMOD_SYMBOLIC_PATTERN.match(item)
+        if match and match.group("perm") in ("u", "g", "o"):
+            return None
+    return _parse_symbolic_mode(-1, symbolic_mode), _parse_symbolic_mode(0, symbolic_mode)
+
+
+@lru_cache(maxsize=256)
+def _parse_symbolic_mode(base_mode: int, symbolic_mode: str) -> int:
+    """Return integer mode from applying a symbolic mode to a base mode."""
+    # NOTE: This is cached since the same symbolic mode is typically applied to many paths that
+    # share the same base mode (e.g. when recursively changing the mode of a directory tree).
     mode = base_mode
     items = symbolic_mode.split(",")
 
@@ -182,17 +256,15 @@ def _get_symbolic_mode(base_mode: int, symbolic_mode: str) -> int:
         if not who:
             who = "a"
 
-        mask = 0
-        for who_char, perm_char in itertools.product(who, perm):
-            if perm_char in "ugo":
-                # Permission character is a who-class that we should inherit permissions from.
-                submask = _get_inherited_symbolic_mode(mode, to_who=who_char, from_who=perm_char)
-            else:
-                symbol = who_char + perm_char
-                if symbol not in CHMOD_SYMBOLIC_TABLE:
-                    raise ValueError(f"chmod: Unsupported symbolic mode: {symbolic_mode}")
-                submask = CHMOD_SYMBOLIC_TABLE[symbol]
-            mask |= submask
+        if perm in ("u", "g", "o"):
+            # Permission character is a who-class that we should inherit permissions from.
+            mask = 0
+            for who_char in who:
+                mask |= _get_inherited_symbolic_mode(mode, to_who=who_char, from_who=perm)
+        else:
+            mask = _get_symbolic_perm_mask(who, perm)
+            if mask is None:
+                raise ValueError(f"chmod: Unsupported symbolic mode: {symbolic_mode}")
 
         if op == "=":
             # Since we're setting permissions to be equal to the given mode, clear the existing
@@ -208,28 +280,35 @@ def _get_symbolic_mode(base_mode: int, symbolic_mode: str) -> int:
     return mode
 
 
+@lru_cache(maxsize=256)
+def _get_symbolic_perm_mask(who: str, perm: str) -> t.Optional[int]:
+    """
+    Return integer mask for permission characters applied to user classes.
+
+    ``None`` is returned if any combination of user class and permission isn't supported.
+    """
+    mask = 0
+    for who_char, perm_char in itertools.product(who, perm):
+        symbol = who_char + perm_char
+        if symbol not in CHMOD_SYMBOLIC_TABLE:
+            return None
+        mask |= CHMOD_SYMBOLIC_TABLE[symbol]
+    return mask
+
+
 def _get_inherited_symbolic_mode(base_mode: int, to_who: str, from_who: str) -> int:
     """Return integer mode by inheriting the permissions from another symbolic user class."""
     mode = 0
-    for perm_char in "rwxst":
-        from_symbol = from_who + perm_char
-        to_symbol = to_who + perm_char
-        if (
-            from_symbol in CHMOD_SYMBOLIC_TABLE
-            and to_symbol in CHMOD_SYMBOLIC_TABLE
-            and base_mode & CHMOD_SYMBOLIC_TABLE[from_symbol]
-        ):
-            mode |= CHMOD_SYMBOLIC_TABLE[to_symbol]
+    for from_bit, to_bit in CHMOD_SYMBOLIC_INHERIT_TABLE[(to_who, from_who)]:
+        if base_mode & from_bit:
+            mode |= to_bit
     return mode
 
 
 def _clear_symbolic_mode(mode: int, who: str) -> int:
     """Return integer mode that has been cleared for a given symbolic user class."""
-    for who_char, perm_char in itertools.product(who, "rwxst"):
-        symbol = who_char + perm_char
-        if symbol not in CHMOD_SYMBOLIC_TABLE:
-            continue
-        mode &= ~CHMOD_SYMBOLIC_TABLE[who_char + perm_char]
+    for who_char in who:
+        mode &= ~CHMOD_SYMBOLIC_WHO_MASKS[who_char]
     return mode
 
 
@@ -273,16 +352,19 @@ def chown(
         if gid is None:
             raise LookupError(f"chown: no such group: {group!r}")
 
-    if not isinstance(path, int):
-        path = Path(path)
-
     os.chown(path, uid, gid, follow_symlinks=follow_symlinks)
 
-    if recursive and isinstance(path, Path) and path.is_dir():
-        for subpath in walk(path):
-            # Disable recursive option so we can handle all sub-paths from here instead of using
-            # recursive function calls.
-            chown(subpath, uid, gid, follow_symlinks=follow_symlinks, recursive=False)
+    if recursive and not isinstance(path, int) and os.path.isdir(path):
+        if not _WALKAT_SUPPORTED:  # pragma: no cover
+            for subpath in walk(path):
+                # Disable recursive option so we can handle all sub-paths from here instead of using
+                # recursive function calls.
+                chown(subpath, uid, gid, follow_symlinks=follow_symlinks, recursive=False)
+            return
+
+        os_chown = os.chown
+        for name, dir_fd in _walkat(path):
+            os_chown(name, uid, gid, dir_fd=dir_fd, follow_symlinks=follow_symlinks)
 
 
 def _get_uid(name: t.Optional[t.Union[str, int]]) -> t.Optional[int]:
@@ -292,12 +374,20 @@ def _get_uid(name: t.Optional[t.Union[str, int]]) -> t.Optional[int]:
         uid = name
     elif isinstance(name, str):
         try:
-            uid = getpwnam(name).pw_uid
+            uid = _lookup_uid(name)
         except (KeyError, TypeError, ValueError):
             pass
     return uid
 
 
+@lru_cache(maxsize=1024)
+def _lookup_uid(name: str) -> int:
+    """Return the uid of a user name."""
+    # NOTE: This is cached since user lookups can be slow (e.g. when backed by LDAP). Unknown names
+    # raise instead of returning so that they aren't cached in case the user is added later.
+    return getpwnam(name).pw_uid
+
+
 def _get_gid(name: t.Optional[t.Union[str, int]]) -> t.Optional[int]:
     """Return a gid given a group name."""
     gid: t.Optional[int] = None
@@ -305,18 +395,31 @@ def _get_gid(name: t.Optional[t.Union[str, int]]) -> t.Optional[int]:
         gid = name
     elif isinstance(name, str):
         try:
-            gid = getgrnam(name).gr_gid
+            gid = _lookup_gid(name)
         except (KeyError, TypeError, ValueError):
             pass
     return gid
 
 
-def cp(src: StrPath, dst: StrPath, *, follow_symlinks: bool = True) -> None:
+@lru_cache(maxsize=1024)
+def _lookup_gid(name: str) -> int:
+    """Return the gid of a group name."""
+    # NOTE: This is cached for the same reasons as _lookup_uid().
+    return getgrnam(name).gr_gid
+
+
+def cp(src: StrPath, dst: StrPath, *, follow_symlinks: bool = True, atomic: bool = False) -> None:
     """
     Copy file or directory to destination.
 
-    Files are copied atomically by first copying to a temporary file in the same target directory
-    and then renaming the temporary file to its actual filename.
+    Files are copied directly to their destination unless ``atomic=True`` in which case they are
+    copied atomically by first copying to a temporary file in the same target directory and then
+    renaming the temporary file to its actual filename.
+
+    When not atomic, an existing destination file is overwritten in place if it's a writable
+    regular file with no other hard links. Otherwise (e.g. a read-only file, a hard link, or a
+    symlink), it's replaced by a temporary copy the same as an atomic copy so that its other links
+    are left unchanged.
 
     Args:
         src: Source file or directory to copy from.
@@ -324,54 +427,168 @@ def cp(src: StrPath, dst: StrPath, *, follow_symlinks: bool = True) -> None:
         follow_symlinks: When true (the default), symlinks in the source will be dereferenced into
             the destination. When false, symlinks in the source will be preserved as symlinks in the
             destination.
+        atomic: Whether to copy each file atomically.
     """
     src = Path(src)
     dst = Path(dst)
     mkdir(dst.parent)
 
-    if src.is_dir():
-        if dst.exists() and not dst.is_dir():
+    # Stat each path once and branch on the results instead of calling is_dir() and friends.
+    src_stat = _stat_or_none(src)
+    dst_stat = _stat_or_none(dst)
+
+    if src_stat and stat.S_ISDIR(src_stat.st_mode):
+        if dst_stat and not stat.S_ISDIR(dst_stat.st_mode):
             raise FileExistsError(
                 errno.EEXIST, f"Cannot copy {src!r} to {dst!r} since destination is a file"
             )
 
-        if dst.is_dir():
+        if dst_stat:
             src_dirname = str(src)
             dst_dirname = str(dst)
-            for src_dir, _dirs, files in os.walk(str(src)):
-                dst_dir = src_dir.replace(src_dirname, dst_dirname, 1)
+            src_dirname_len = len(src_dirname)
+            join = os.path.join
+            for src_dir, _dirs, files in os.walk(src_dirname):
+                # Walked directories are always prefixed with the source directory so they can be
+                # mapped to the destination without searching the path.
+                dst_dir = dst_dirname + src_dir[src_dirname_len:]
+                # Each destination directory only needs to be created once for all of its files and
+                # the top-level one is already known to exist. Since the walk is top-down, the
+                # parent has always been created already so a single mkdir is enough.
+                if src_dir != src_dirname:
+                    _mkdirchild(dst_dir)
                 for file in files:
-                    src_file = os.path.join(src_dir, file)
-                    dst_file = os.path.join(dst_dir, file)
-                    cp(src_file, dst_file, follow_symlinks=follow_symlinks)
+                    src_file = join(src_dir, file)
+                    dst_file = join(dst_dir, file)
+                    _copyfile(src_file, dst_file, follow_symlinks=follow_symlinks, atomic=atomic)
         else:
 
             def copy_function(_src, _dst):
-                return cp(_src, _dst, follow_symlinks=follow_symlinks)
+                return _copyfile(_src, _dst, follow_symlinks=follow_symlinks, atomic=atomic)
 
             shutil.copytree(src, dst, symlinks=not follow_symlinks, copy_function=copy_function)
     else:
-        if dst.is_dir():
+        if dst_stat and stat.S_ISDIR(dst_stat.st_mode):
             dst = dst / src.name
+        _copyfile(str(src), str(dst), follow_symlinks=follow_symlinks, atomic=atomic)
+
+
+def _copyfile(src: str, dst: str, *, follow_symlinks: bool = True, atomic: bool = False) -> None:
+    """Copy file to destination whose parent directory is assumed to exist."""
+    copy_link = not follow_symlinks and os.path.islink(src)
+
+    if not atomic and not copy_link:
+        dst_stat = _stat_or_none(dst, follow_symlinks=False)
+        # Only writable regular files without other hard links can be copied over in place. Others
+        # (e.g. symlinks or hard links which would otherwise be written through) are replaced by a
+        # copy staged under a temporary name.
+        if dst_stat is None or (
+            stat.S_ISREG(dst_stat.st_mode)
+            and dst_stat.st_nlink == 1
+            and dst_stat.st_mode & stat.S_IWUSR
+            and os.access(dst, os.W_OK)
+        ):
+            _copy2(src, dst, follow_symlinks=follow_symlinks)
+            return
+
+    if copy_link:
+        # Symlinks are created by name and can't be copied over an existing file so there's no
+        # temporary file to reserve for them.
         tmp_dst = _candidate_temp_pathname(path=dst, prefix="_")
-        shutil.copy2(src, tmp_dst, follow_symlinks=follow_symlinks)
+    else:
+        # Reserve the temporary file exclusively so that the name can't be taken by another process
+        # between choosing it and copying to it.
+        tmp_fd, tmp_dst = _mktempfile(path=dst, prefix="_")
+        os.close(tmp_fd)
+
+    try:
+        _copy2(src, tmp_dst, follow_symlinks=follow_symlinks)
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        rm(tmp_dst)
+        raise
+
+
+def _copy2(src: str, dst: str, *, follow_symlinks: bool = True) -> None:
+    """Like ``shutil.copy2`` but try copying the contents in-kernel first."""
+    if _copyfilerange(src, dst, follow_symlinks=follow_symlinks):
+        shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    else:
+        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _copyfilerange(src: str, dst: str, *, follow_symlinks: bool = True) -> bool:
+    """
+    Copy regular file contents to file using ``os.copy_file_range`` so that the copy is done
+    in-kernel (and possibly as a reflink) without passing data through userspace.
+
+    Return ``False`` when the fast path isn't usable so that the caller can fall back to
+    ``shutil.copy2`` (which already uses ``os.sendfile`` on Linux).
+    """
+    if not hasattr(os, "copy_file_range"):  # pragma: no cover
+        return False
+
+    src_stat = os.stat(src, follow_symlinks=follow_symlinks)
+    # Files like those in /proc can report a size of zero while still having content.
+    if not stat.S_ISREG(src_stat.st_mode) or not src_stat.st_size:
+        return False
+
+    # Leave existing non-regular files and copies onto the source itself to shutil.copy2 so that
+    # they are handled (or rejected) the same way.
+    dst_stat = _stat_or_none(dst)
+    if dst_stat and (not stat.S_ISREG(dst_stat.st_mode) or os.path.samestat(src_stat, dst_stat)):
+        return False
+
+    copied = 0
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
         try:
-            os.rename(tmp_dst, dst)
-        except OSError:  # pragma: no cover
-            rm(tmp_dst)
-            raise
+            while True:
+                try:
+                    count = os.copy_file_range(src_fd, dst_fd, _COPY_FILE_RANGE_MAX_COUNT)
+                except OSError as exc:
+                    if copied or exc.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                        raise
+                    # Nothing was copied so shutil.copy2 can overwrite the empty destination.
+                    break
+
+                if not count:
+                    break
+                copied += count
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    return bool(copied)
 
 
 def dirsync(path: StrPath) -> None:
     """
     Force sync on directory.
 
+    This is a no-op on Windows and on filesystems that don't support syncing directories.
+
     Args:
         path: Directory to sync.
     """
+    if os.name == "nt":  # pragma: no cover
+        # Directories can't be opened (or synced) on Windows.
+        return
+
     fd = os.open(path, os.O_RDONLY)
     try:
-        fsync(fd)
+        # Only check the device when there are any known to not support syncing directories so that
+        # the common case doesn't need an extra fstat call.
+        if _dirsync_unsupported_devices and os.fstat(fd).st_dev in _dirsync_unsupported_devices:
+            return
+        try:
+            fsync(fd)
+        except OSError as exc:
+            if exc.errno not in _DIRSYNC_UNSUPPORTED_ERRNOS:
+                raise
+            _dirsync_unsupported_devices.add(os.fstat(fd).st_dev)
     finally:
         os.close(fd)
 
@@ -403,11 +620,16 @@ def environ(
     try:
         yield os.environ.copy()
     finally:
-        os.environ.clear()
-        os.environ.update(orig_env)
+        # Only undo what changed since each os.environ assignment or deletion also calls putenv() or
+        # unsetenv() which would otherwise be done for every variable.
+        for key in [key for key in os.environ if key not in orig_env]:
+            del os.environ[key]
+        for key, value in orig_env.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
 
 
-def fsync(fd: t.Union[t.IO, int]) -> None:
+def fsync(fd: t.Union[t.IO, int], *, data_only: bool = False) -> None:
     """
     Force write of file to disk.
 
@@ -415,28 +637,33 @@ def fsync(fd: t.Union[t.IO, int]) -> None:
     if available) called on it. If a file object is passed it, then it will first be flushed before
     synced.
 
+    If `data_only` is ``True``, then ``os.fdatasync()`` will be used instead of ``os.fsync()`` when
+    available. This only flushes the file's data and the metadata needed to read it back (like its
+    size) and skips metadata like modification times which can make it faster.
+
     Args:
         fd: Either file descriptor integer or file object.
+        data_only: Whether to only sync the file's data instead of its data and all metadata.
     """
-    if (
-        not isinstance(fd, int)
-        and not (hasattr(fd, "fileno") and hasattr(fd, "flush"))
-        or isinstance(fd, bool)
-    ):
-        raise ValueError(
-            f"File descriptor must be a fileno integer or file-like object, not {type(fd)}"
-        )
-
-    if isinstance(fd, int):
+    # Validate file objects as they're used instead of checking for their attributes up front since
+    # this is called for every atomic write. Booleans are ints but not valid file descriptors.
+    if isinstance(fd, int) and type(fd) is not bool:
         fileno = fd
     else:
-        fileno = fd.fileno()
-        fd.flush()
-
-    if hasattr(fcntl, "F_FULLFSYNC"):  # pragma: no cover
+        try:
+            fileno = fd.fileno()
+            fd.flush()
+        except AttributeError:
+            raise ValueError(
+                f"File descriptor must be a fileno integer or file-like object, not {type(fd)}"
+            ) from None
+
+    if _HAS_FULLFSYNC:  # pragma: no cover
         # Necessary for MacOS to do proper fsync: https://bugs.python.org/issue11877
         # pylint: disable=no-member
         fcntl.fcntl(fileno, fcntl.F_FULLFSYNC)  # type: ignore
+    elif data_only and _HAS_FDATASYNC:
+        os.fdatasync(fileno)
     else:  # pragma: no cover
         os.fsync(fileno)
 
@@ -452,6 +679,9 @@ def getdirsize(path: StrPath, pattern: str = "**/*") -> int:
     Returns:
         Total size of directory in bytes.
     """
+    if pattern == "**/*":
+        return _getdirsize(path)
+
     total_size = 0
 
     for item in Path(path).glob(pattern):
@@ -465,7 +695,35 @@ def getdirsize(path: StrPath, pattern: str = "**/*") -> int:
     return total_size
 
 
-def mkdir(*paths: StrPath, mode: int = 0o777, exist_ok: bool = True) -> None:
+def _getdirsize(path: StrPath) -> int:
+    """Return total size of all files in directory using ``os.scandir`` to avoid extra stats."""
+    total_size = 0
+    dirs = [path]
+
+    while dirs:
+        try:
+            scanner = os.scandir(dirs.pop())
+        except OSError:
+            # Like globbing, paths that aren't readable directories (including a missing or file
+            # path given as the top-level directory) are skipped.
+            continue
+
+        with scanner as entries:
+            for entry in entries:
+                try:
+                    # Like "**" globbing, symlinked directories are not recursed into.
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                except OSError:  # pragma: no cover
+                    # File doesn't exist or is inaccessible.
+                    pass
+
+    return total_size
+
+
+def mkdir(*paths: StrPath, mode: int = 0o777, exist_ok: bool = True, workers: int = 1) -> None:
     """
     Recursively create directories in `paths` along with any parent directories that don't already
     exists.
@@ -477,9 +735,37 @@ def mkdir(*paths: StrPath, mode: int = 0o777, exist_ok: bool = True) -> None:
         mode: Access mode for directories.
         exist_ok: Whether it's ok or not if the path already exists. When ``True``, a
             ``FileExistsError`` will be raised.
+        workers: Number of threads to process paths with when `exist_ok` is ``True``. When
+            greater than ``1``, paths are processed concurrently and every path is attempted before
+            the first error is raised. Defaults to ``1`` which processes paths in order and stops at
+            the first error.
     """
-    for path in paths:
-        os.makedirs(path, mode=mode, exist_ok=exist_ok)
+    if not exist_ok:
+        # Creating nested paths concurrently could fail when a parent is created by another path.
+        for path in paths:
+            os.makedirs(path, mode=mode, exist_ok=exist_ok)
+        return
+
+    # Only ensure each directory once when the same path is given more than once (e.g. the parent
+    # directories of many files).
+    paths = tuple(dict.fromkeys(os.fspath(path) for path in paths))
+    _foreachpath(partial(_mkdir, mode=mode), paths, workers=workers)
+
+
+def _mkdir(path: StrPath, mode: int = 0o777) -> None:
+    # Directories usually already exist (e.g. the parent of a file being written) which only takes a
+    # single stat to check compared to the stat, mkdir, and stat that os.makedirs() would use.
+    if not os.path.isdir(path):
+        os.makedirs(path, mode=mode, exist_ok=True)
+
+
+def _mkdirchild(path: str) -> None:
+    """Create directory whose parent is known to exist unless the directory already exists."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
 
 
 def mv(src: StrPath, dst: StrPath) -> None:
@@ -511,23 +797,28 @@ def mv(src: StrPath, dst: StrPath) -> None:
         dst = dst / src.name
 
     try:
-        os.rename(src, dst)
+        os.replace(src, dst)
     except OSError as exc:
         if exc.errno == errno.EXDEV:
             # errno.EXDEV means we tried to move from one file-system to another which is not
             # allowed. In that case, we'll fallback to a copy-and-delete approach instead.
-            tmp_dst = _candidate_temp_pathname(path=dst, prefix="_")
+            if src.is_dir():
+                tmp_dst = _candidate_temp_pathname(path=dst, prefix="_")
+            else:
+                tmp_fd, tmp_dst = _mktempfile(path=dst, prefix="_")
+                os.close(tmp_fd)
             try:
                 cp(src, tmp_dst)
-                os.rename(tmp_dst, dst)
-                rm(src)
-            finally:
+                os.replace(tmp_dst, dst)
+            except BaseException:
                 rm(tmp_dst)
+                raise
+            rm(src)
         else:
             raise
 
 
-def rm(*paths: StrPath) -> None:
+def rm(*paths: StrPath, workers: int = 1) -> None:
     """
     Delete files and directories.
 
@@ -540,18 +831,26 @@ def rm(*paths: StrPath) -> None:
 
     Args:
         *paths: Files and/or directories to delete.
+        workers: Number of threads to process paths with. When greater than ``1``, paths are
+            processed concurrently and every path is attempted before the first error is raised.
+            Defaults to ``1`` which processes paths in order and stops at the first error.
     """
-    for path in paths:
-        try:
-            try:
-                shutil.rmtree(path)
-            except NotADirectoryError:
-                os.remove(path)
-        except FileNotFoundError:
-            pass
+    _foreachpath(_rm, paths, workers=workers, prune_nested=True)
 
 
-def rmdir(*dirs: StrPath) -> None:
+def _rm(path: StrPath) -> None:
+    # Check the path type up front instead of letting shutil.rmtree() fail on files (which are the
+    # more common case) before removing them. Symlinks are removed without touching their targets.
+    try:
+        if stat.S_ISDIR(os.lstat(path).st_mode):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def rmdir(*dirs: StrPath, workers: int = 1) -> None:
     """
     Delete directories.
 
@@ -564,18 +863,24 @@ def rmdir(*dirs: StrPath) -> None:
 
     Args:
         *dirs: Directories to delete.
+        workers: Number of threads to process paths with. When greater than ``1``, paths are
+            processed concurrently and every path is attempted before the first error is raised.
+            Defaults to ``1`` which processes paths in order and stops at the first error.
 
     Raises:
         NotADirectoryError: When given path is not a directory.
     """
-    for path in dirs:
-        try:
-            shutil.rmtree(path)
-        except FileNotFoundError:
-            pass
+    _foreachpath(_rmdir, dirs, workers=workers, prune_nested=True)
 
 
-def rmfile(*files: StrPath) -> None:
+def _rmdir(path: StrPath) -> None:
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+
+
+def rmfile(*files: StrPath, workers: int = 1) -> None:
     """
     Delete files.
 
@@ -584,28 +889,47 @@ def rmfile(*files: StrPath) -> None:
 
     Args:
         *files: Files to delete.
+        workers: Number of threads to process paths with. When greater than ``1``, paths are
+            processed concurrently and every path is attempted before the first error is raised.
+            Defaults to ``1`` which processes paths in order and stops at the first error.
 
     Raises:
         IsADirectoryError: When given path is a directory.
     """
-    for path in files:
-        try:
-            os.remove(path)
-        except FileNotFoundError:
-            pass
+    _foreachpath(_rmfile, files, workers=workers)
+
 
+def _rmfile(path: StrPath) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
 
-def touch(*paths: StrPath) -> None:
+
+def touch(*paths: StrPath, workers: int = 1) -> None:
     """
     Touch files.
 
     Args:
         *paths: File paths to create.
+        workers: Number of threads to process paths with. When greater than ``1``, paths are
+            processed concurrently and every path is attempted before the first error is raised.
+            Defaults to ``1`` which processes paths in order and stops at the first error.
     """
-    for path in paths:
-        path = Path(path)
-        mkdir(path.parent)
-        path.touch()
+    _foreachpath(_touch, paths, workers=workers)
+
+
+def _touch(path: StrPath) -> None:
+    # Like Path.touch() but an existing file only needs a single utime call and there's no need to
+    # check that its parent directory exists.
+    try:
+        os.utime(path, None)
+        return
+    except OSError:
+        pass
+
+    _mkdir(os.path.dirname(os.fspath(path)) or os.curdir)
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o666))
 
 
 @contextmanager
@@ -632,25 +956,146 @@ def _candidate_temp_pathname(
     """Return random temporary path name that doesn't yet exist."""
     tries = 100
     for _ in range(tries):
-        filename = Path(_random_name(path=path, prefix=prefix, suffix=suffix))
-        if hidden:
-            filename = filename.parent / f".{filename.name}"
-        if not filename.exists():
-            return str(filename)
+        filename = _temp_pathname(path=path, prefix=prefix, suffix=suffix, hidden=hidden)
+        if not os.path.lexists(filename):
+            return filename
     raise FileNotFoundError(
         errno.ENOENT, f"No usable temporary filename found in {Path(prefix).absolute()}"
     )  # pragma: no cover
 
 
+def _mktempfile(
+    path: StrPath = "", prefix: StrPath = "", suffix: StrPath = "", hidden: bool = True
+) -> t.Tuple[int, str]:
+    """
+    Create new temporary file exclusively and return its open file descriptor and path name.
+
+    Unlike checking whether a candidate name exists before creating it, the file creation itself
+    fails if the name is taken so there's no race with other processes and no extra stat.
+    """
+    flags = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    tries = 100
+    for _ in range(tries):
+        filename = _temp_pathname(path=path, prefix=prefix, suffix=suffix, hidden=hidden)
+        try:
+            return os.open(filename, flags, 0o666), filename
+        except FileExistsError:
+            continue
+    raise FileExistsError(
+        errno.EEXIST, f"No usable temporary filename found in {Path(prefix).absolute()}"
+    )  # pragma: no cover
+
+
+def _mktempdir(
+    path: StrPath = "", prefix: StrPath = "", suffix: StrPath = "", hidden: bool = True
+) -> str:
+    """Create new temporary directory exclusively and return its path name."""
+    tries = 100
+    for _ in range(tries):
+        dirname = _temp_pathname(path=path, prefix=prefix, suffix=suffix, hidden=hidden)
+        try:
+            os.mkdir(dirname)
+            return dirname
+        except FileExistsError:
+            continue
+    raise FileExistsError(
+        errno.EEXIST, f"No usable temporary directory name found in {Path(prefix).absolute()}"
+    )  # pragma: no cover
+
+
+def _temp_pathname(
+    path: StrPath = "", prefix: StrPath = "", suffix: StrPath = "", hidden: bool = True
+) -> str:
+    """Return random temporary path name."""
+    filename = _random_name(path=path, prefix=prefix, suffix=suffix)
+    if hidden:
+        head, tail = os.path.split(filename)
+        filename = os.path.join(head, f".{tail}")
+    return filename
+
+
+def _stat_or_none(path: StrPath, *, follow_symlinks: bool = True) -> t.Optional[os.stat_result]:
+    """Return ``os.stat`` result of path or ``None`` if it doesn't exist."""
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _walkat(path: StrPath) -> t.Iterator[t.Tuple[str, int]]:
+    """
+    Yield the name of each file and directory under a directory along with a file descriptor of
+    its parent directory that the name is relative to.
+
+    Symlinks to directories under the directory are yielded but not walked into while a symlink to
+    a directory given as `path` is walked. The file descriptor is only valid until the next
+    directory's entries are yielded. Errors from reading a directory are raised.
+    """
+    # Only a symlink given as the top directory is followed since os.fwalk() would otherwise either
+    # not walk it at all or walk into every symlinked subdirectory too.
+    if os.path.islink(path):
+        path = os.path.realpath(path)
+
+    for _dir_path, dir_names, file_names, dir_fd in os.fwalk(path, onerror=_raise):
+        for name in itertools.chain(dir_names, file_names):
+            yield name, dir_fd
+
+
+def _raise(exc: BaseException) -> None:
+    """Raise the given exception (e.g. from an ``onerror`` callback)."""
+    raise exc
+
+
+def _foreachpath(
+    fn: t.Callable[[StrPath], t.Any],
+    paths: t.Sequence[StrPath],
+    *,
+    workers: int = 1,
+    prune_nested: bool = False,
+) -> None:
+    """
+    Call `fn` on each path in order or from a thread pool of `workers` threads.
+
+    A thread pool lets the blocking system calls of each path overlap. When using it, every path is
+    processed before the first error is raised and, when `prune_nested` is true, paths under another
+    given path are skipped so that the same files aren't operated on concurrently.
+    """
+    if workers <= 1 or len(paths) < 2:
+        for path in paths:
+            fn(path)
+        return
+
+    if prune_nested:
+        paths = _prunenested(paths)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        futures = [executor.submit(fn, path) for path in paths]
+
+    for future in futures:
+        future.result()
+
+
+def _prunenested(paths: t.Iterable[StrPath]) -> t.List[StrPath]:
+    """Return paths with any that are under another path removed."""
+    pruned: t.List[StrPath] = []
+    parent: t.Optional[t.List[str]] = None
+    # Sorting by path parts places each path directly before the paths nested under it.
+    entries = sorted(
+        ([part for part in os.path.abspath(path).split(os.sep) if part], i, path)
+        for i, path in enumerate(paths)
+    )
+    for parts, _, path in entries:
+        if parent is not None and parts[: len(parent)] == parent:
+            continue
+        pruned.append(path)
+        parent = parts
+    return pruned
+
+
 def _random_name(
     path: StrPath = "", prefix: StrPath = "", suffix: StrPath = "", length: int = 8
 ) -> str:
     """Return generated random path name."""
-    _pid, _random = getattr(_random_name, "_state", (None, None))
-    if _pid != os.getpid() or not _random:
-        # Ensure separate processes don't share same random generator.
-        _random = random.Random()
-        _random_name._state = (os.getpid(), _random)  # type: ignore
-
-    inner = "".join(_random.choice(string.ascii_letters) for _ in range(length))
+    # Random bytes come straight from the OS so there's no generator state to reseed after a fork.
+    inner = secrets.token_hex((length + 1) // 2)[:length]
     return f"{path}{prefix}{inner}{suffix}"
@@ -1,13 +1,38 @@
 """The path module contains utilities for working with OS paths."""
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 import fnmatch
+from functools import lru_cache
+from itertools import islice
 import os
 from pathlib import Path
+import re
 import typing as t
 from typing import Iterable
 
-from .types import LsFilter, LsFilterable, LsFilterFn, StrPath
+from .types import LsFilter, LsFilterable, StrPath
+
+
+# Filters used while listing are given the path as a string so that a Path object is only created
+# for paths that are yielded (or given to callable filters) and the DirEntry of the path so that
+# file type checks can use its cached file type instead of stat'ing the path again.
+_LsEntryFilterFn = t.Callable[[str, os.DirEntry], bool]
+
+# Number of directory entries read at a time while listing a directory.
+SCANDIR_CHUNK_SIZE = 4096
+
+# Directories can be identified by their (st_dev, st_ino) while walking so that directories
+# reachable from more than one path (e.g. from bind mounts) are only walked once. This requires an
+# lstat of each subdirectory since DirEntry doesn't provide the device of the entry (and its inode
+# is the one of the mount point rather than the mounted directory) so it's opt-in.
+_DirId = t.Tuple[int, int]
+
+# Multiple glob patterns of the same filter are matched together as a tuple of patterns.
+_LsFilterables = t.Union[LsFilterable, t.Tuple[str, ...]]
+
+# Characters that make a glob pattern more than a literal string.
+_GLOB_MAGIC_CHARS = re.compile(r"[*?[]")
 
 
 class Ls:
@@ -28,6 +53,13 @@ class Ls:
             iterable containing any of those types. Path is not yielded if any of the filters return
             ``True``. If the path is a directory and is excluded, then all of its contents will be
             excluded.
+        workers: Number of threads to scan directories with when recursive. Directories are
+            scanned concurrently when greater than ``1`` in which case paths are not listed in
+            depth-first order and `include` and `exclude` filters are called from the worker
+            threads so callable filters must be thread-safe. Defaults to ``1``.
+        visit_once: Whether to only walk directories that are reachable from more than one path
+            (e.g. through bind mounts) once when recursive. Each subdirectory is ``lstat``'d to
+            identify it when enabled. Defaults to ``False``.
     """
 
     def __init__(
@@ -39,18 +71,17 @@ class Ls:
         only_dirs: bool = False,
         include: t.Optional[LsFilter] = None,
         exclude: t.Optional[LsFilter] = None,
+        workers: int = 1,
+        visit_once: bool = False,
     ):
         if only_files and only_dirs:
             raise ValueError("only_files and only_dirs cannot both be true")
 
-        include_filters: t.List[t.Callable[[Path], bool]] = []
-        exclude_filters: t.List[t.Callable[[Path], bool]] = []
+        include_filters: t.List[_LsEntryFilterFn] = []
+        exclude_filters: t.List[_LsEntryFilterFn] = []
 
         if include:
-            if isinstance(include, Iterable) and not isinstance(include, (str, bytes)):
-                includes = include
-            else:
-                includes = [include]
+            includes = _mergeglobs(_aslist(include))
             # When creating the include filters, need to also take into account the only_* filter
             # settings so that an include filter will only match if both are true.
             include_filters.extend(
@@ -64,16 +95,15 @@ class Ls:
             include_filters.append(_make_ls_filter(only_files=only_files, only_dirs=only_dirs))
 
         if exclude:
-            if isinstance(exclude, Iterable) and not isinstance(exclude, (str, bytes)):
-                excludes = exclude
-            else:
-                excludes = [exclude]
+            excludes = _mergeglobs(_aslist(exclude))
             exclude_filters.extend(_make_ls_filter(filterable=excl) for excl in excludes)
 
         self.path = path
         self.recursive = recursive
         self.include_filters = include_filters
         self.exclude_filters = exclude_filters
+        self.workers = workers
+        self.visit_once = visit_once
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(path={self.path!r}, recursive={self.recursive})"
@@ -87,68 +117,246 @@ class Ls:
 
     def __iter__(self) -> t.Iterator[Path]:
         """Iterate over :attr:`path` and yield its contents."""
-        yield from _ls(
-            self.path,
-            recursive=self.recursive,
-            include_filters=self.include_filters,
-            exclude_filters=self.exclude_filters,
-        )
+        if self.recursive and self.workers > 1:
+            yield from _ls_parallel(
+                self.path,
+                workers=self.workers,
+                visit_once=self.visit_once,
+                include_filters=self.include_filters,
+                exclude_filters=self.exclude_filters,
+            )
+        else:
+            yield from _ls(
+                self.path,
+                recursive=self.recursive,
+                visit_once=self.visit_once,
+                include_filters=self.include_filters,
+                exclude_filters=self.exclude_filters,
+            )
 
 
 def _ls(
     path: StrPath = ".",
     *,
     recursive: bool = False,
-    include_filters: t.Optional[t.List[LsFilterFn]] = None,
-    exclude_filters: t.Optional[t.List[LsFilterFn]] = None,
+    visit_once: bool = False,
+    include_filters: t.Optional[t.List[_LsEntryFilterFn]] = None,
+    exclude_filters: t.Optional[t.List[_LsEntryFilterFn]] = None,
+) -> t.Generator[Path, None, None]:
+    # Directories are walked from a stack instead of recursively so that each yielded path doesn't
+    # have to pass through a generator for every directory level above it. Subdirectories are pushed
+    # in reverse so that they are still listed in the same depth-first order.
+    # Paths are kept as strings and normalized the same as Path() would so that they can be filtered
+    # before deciding whether a Path needs to be created.
+    # Each directory is fully scanned before its paths are yielded so that its os.scandir() handle
+    # isn't kept open while the caller processes them (e.g. while removing or creating paths in it).
+    dirs = [os.fspath(Path(path))]
+    is_included = _anyfilter(include_filters)
+    is_excluded = _anyfilter(exclude_filters)
+    visited = {_root_dir_id(dirs[0])} if recursive and visit_once else None
+
+    while dirs:
+        recurse_into: t.List[t.Tuple[str, t.Optional[_DirId]]] = []
+        listed = list(
+            _lsdir(dirs.pop(), is_included, is_excluded, recurse_into, recursive, visit_once)
+        )
+
+        yield from map(Path, listed)
+
+        dirs.extend(reversed(_unvisited(recurse_into, visited)))
+
+
+def _ls_parallel(
+    path: StrPath = ".",
+    *,
+    workers: int,
+    visit_once: bool = False,
+    include_filters: t.Optional[t.List[_LsEntryFilterFn]] = None,
+    exclude_filters: t.Optional[t.List[_LsEntryFilterFn]] = None,
 ) -> t.Generator[Path, None, None]:
-    scanner = os.scandir(Path(path))
-    recurse_into: t.List[str] = []
+    # Each directory is scanned by a worker thread and its subdirectories are submitted as separate
+    # scans so that os.scandir() calls of independent subtrees overlap. A directory's paths are
+    # yielded once it has been scanned so they aren't listed in depth-first order. Visited
+    # directories are only tracked from this thread so that the visited set isn't shared.
+    is_included = _anyfilter(include_filters)
+    is_excluded = _anyfilter(exclude_filters)
+
+    def scan(dir_path: str) -> t.Tuple[t.List[str], t.List[t.Tuple[str, t.Optional[_DirId]]]]:
+        recurse_into: t.List[t.Tuple[str, t.Optional[_DirId]]] = []
+        listed = list(_lsdir(dir_path, is_included, is_excluded, recurse_into, True, visit_once))
+        return listed, recurse_into
+
+    root = os.fspath(Path(path))
+    visited = {_root_dir_id(root)} if visit_once else None
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = {executor.submit(scan, root)}
+
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-    with scanner:
+            for future in done:
+                listed, recurse_into = future.result()
+                pending.update(
+                    executor.submit(scan, dir_path)
+                    for dir_path in _unvisited(recurse_into, visited)
+                )
+
+                yield from map(Path, listed)
+    finally:
+        # Stop scanning when iteration ends early or a scan fails.
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+
+def _lsdir(
+    dir_path: str,
+    is_included: t.Optional[_LsEntryFilterFn],
+    is_excluded: t.Optional[_LsEntryFilterFn],
+    recurse_into: t.List[t.Tuple[str, t.Optional[_DirId]]],
+    recursive: bool,
+    visit_once: bool,
+) -> t.Generator[str, None, None]:
+    """
+    Yield the included paths of a directory and add its subdirectories and their IDs (when
+    `visit_once` is ``True``) to ``recurse_into``.
+    """
+    # Entries of the current directory would be "./<name>" which Path() shortens to "<name>".
+    in_curdir = dir_path == os.curdir
+
+    for entries in _scandir_chunks(dir_path):
+        for entry in entries:
+            entry_path = entry.name if in_curdir else entry.path
+            excluded = is_excluded is not None and is_excluded(entry_path, entry)
+
+            if not excluded and (is_included is None or is_included(entry_path, entry)):
+                yield entry_path
+
+            # Symlinked directories aren't recursed into.
+            if recursive and not excluded and entry.is_dir(follow_symlinks=False):
+                recurse_into.append((entry_path, _dir_id(entry) if visit_once else None))
+
+
+def _scandir_chunks(
+    path: str, size: t.Optional[int] = None
+) -> t.Generator[t.List[os.DirEntry], None, None]:
+    """Yield the entries of a directory in lists of up to ``size`` entries."""
+    # Reading entries into lists with islice() avoids a next() call (and its StopIteration handling)
+    # in Python for every entry of large directories.
+    if size is None:
+        size = SCANDIR_CHUNK_SIZE
+
+    with os.scandir(path) as scanner:
         while True:
             try:
-                try:
-                    entry = next(scanner)
-                except StopIteration:
-                    break
+                entries = list(islice(scanner, size))
             except OSError:  # pragma: no cover
-                return
+                break
 
-            entry_path = Path(entry.path)
-            excluded = exclude_filters and any(
-                is_excluded(entry_path) for is_excluded in exclude_filters
-            )
+            if entries:
+                yield entries
 
-            if not excluded and (
-                not include_filters
-                or any(is_included(entry_path) for is_included in include_filters)
-            ):
-                yield entry_path
+            if len(entries) < size:
+                break
 
-            if recursive and not excluded and entry_path.is_dir() and not entry_path.is_symlink():
-                recurse_into.append(entry.path)
 
-    for subdir in recurse_into:
-        yield from _ls(
-            subdir,
-            recursive=recursive,
-            include_filters=include_filters,
-            exclude_filters=exclude_filters,
-        )
+def _dir_id(entry: os.DirEntry) -> _DirId:
+    stat_result = entry.stat(follow_symlinks=False)
+    return stat_result.st_dev, stat_result.st_ino
+
+
+def _root_dir_id(path: str) -> _DirId:
+    stat_result = os.stat(path)
+    return stat_result.st_dev, stat_result.st_ino
+
+
+def _unvisited(
+    dirs: t.List[t.Tuple[str, t.Optional[_DirId]]], visited: t.Optional[t.Set[_DirId]]
+) -> t.List[str]:
+    """
+    Return paths of directories that haven't been visited yet and mark them as visited or all of
+    them when visited directories aren't tracked.
+    """
+    if visited is None:
+        return [dir_path for dir_path, _ in dirs]
+
+    unvisited = []
+
+    for dir_path, dir_id in dirs:
+        if dir_id not in visited:
+            visited.add(dir_id)
+            unvisited.append(dir_path)
+
+    return unvisited
+
+
+def _aslist(ls_filter: LsFilter) -> t.List[LsFilterable]:
+    """Return list of filterables from a single filterable or an iterable of them."""
+    # Check for the single filterable types first since they are the common case and are cheaper to
+    # check than the Iterable ABC. Anything else that isn't iterable is returned as-is so that it's
+    # rejected with the same error as other invalid filter types.
+    if isinstance(ls_filter, (str, bytes, t.Pattern)) or callable(ls_filter):
+        return [ls_filter]  # type: ignore
+    elif isinstance(ls_filter, Iterable):
+        return list(ls_filter)
+    else:
+        return [ls_filter]
+
+
+def _mergeglobs(filterables: t.List[LsFilterable]) -> t.List[_LsFilterables]:
+    """Return filterables with multiple glob patterns merged into a tuple of patterns."""
+    globs = tuple(filterable for filterable in filterables if isinstance(filterable, str))
+
+    if len(globs) < 2:
+        return list(filterables)
+
+    # The merged patterns take the place of the first pattern.
+    merged: t.List[_LsFilterables] = []
+    for filterable in filterables:
+        if not isinstance(filterable, str):
+            merged.append(filterable)
+        elif globs not in merged:
+            merged.append(globs)
+
+    return merged
+
+
+def _anyfilter(
+    filters: t.Optional[t.List[_LsEntryFilterFn]],
+) -> t.Optional[_LsEntryFilterFn]:
+    """
+    Return a single filter that matches when any of the filters match.
+
+    ``None`` is returned if there are no filters.
+    """
+    if not filters:
+        return None
+
+    if len(filters) == 1:
+        return filters[0]
+
+    filter_fns = tuple(filters)
+
+    def _any_filter(path: str, entry: os.DirEntry) -> bool:
+        return any(filter_fn(path, entry) for filter_fn in filter_fns)
+
+    return _any_filter
 
 
 def _make_ls_filter(
-    only_files: bool = False, only_dirs: bool = False, filterable: t.Optional[LsFilterable] = None
-) -> LsFilterFn:
-    filter_fn: t.Optional[LsFilterFn] = None
+    only_files: bool = False,
+    only_dirs: bool = False,
+    filterable: t.Optional[_LsFilterables] = None,
+) -> _LsEntryFilterFn:
+    filter_fn: t.Optional[t.Callable[[str], bool]] = None
     if filterable:
         filter_fn = _make_ls_filterable_fn(filterable)
 
-    def _ls_filter(path: Path) -> bool:
-        if only_files and path.is_dir():
+    def _ls_filter(path: str, entry: os.DirEntry) -> bool:
+        if only_files and entry.is_dir():
             return False
-        elif only_dirs and path.is_file():
+        elif only_dirs and entry.is_file():
             return False
         elif filter_fn:
             return filter_fn(path)
@@ -158,23 +366,20 @@ def _make_ls_filter(
     return _ls_filter
 
 
-def _make_ls_filterable_fn(filterable: LsFilterable) -> LsFilterFn:
-    _ls_filterable_fn: LsFilterFn
-
-    if isinstance(filterable, str):
-
-        def _ls_filterable_fn(path: Path) -> bool:
-            return fnmatch.fnmatch(path, filterable)  # type: ignore
+def _make_ls_filterable_fn(filterable: _LsFilterables) -> t.Callable[[str], bool]:
+    _ls_filterable_fn: t.Callable[[str], bool]
 
+    if isinstance(filterable, (str, tuple)):
+        _ls_filterable_fn = _make_glob_fn(filterable)
     elif isinstance(filterable, t.Pattern):
 
-        def _ls_filterable_fn(path: Path) -> bool:
-            return bool(filterable.match(str(path)))  # type: ignore
+        def _ls_filterable_fn(path: str) -> bool:
+            return bool(filterable.match(path))  # type: ignore
 
     elif callable(filterable):
 
-        def _ls_filterable_fn(path: Path) -> bool:
-            return filterable(path)  # type: ignore
+        def _ls_filterable_fn(path: str) -> bool:
+            return filterable(Path(path))  # type: ignore
 
     else:
         raise TypeError(
@@ -184,6 +389,50 @@ def _make_ls_filterable_fn(filterable: LsFilterable) -> LsFilterFn:
     return _ls_filterable_fn
 
 
+@lru_cache(maxsize=1024)
+def _make_glob_fn(patterns: t.Union[str, t.Tuple[str, ...]]) -> t.Callable[[str], bool]:
+    """Return function that matches a path against one or more glob patterns."""
+    # NOTE: This is cached since the same patterns are typically used for many listings (e.g. when
+    # repeatedly listing a directory) so that they are only translated and compiled once.
+    _glob_fn: t.Callable[[str], bool]
+
+    if isinstance(patterns, tuple):
+        # Multiple patterns are combined into a single regex so that a path is matched against all
+        # of them with one call instead of a call per pattern.
+        match = re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+        ).match
+
+        def _glob_fn(path: str) -> bool:
+            return match(os.path.normcase(path)) is not None
+
+        return _glob_fn
+
+    pattern = os.path.normcase(patterns)
+
+    if not _GLOB_MAGIC_CHARS.search(pattern):
+        # Literal patterns only match the exact path.
+        def _glob_fn(path: str) -> bool:
+            return os.path.normcase(path) == pattern
+
+    elif pattern[0] == "*" and not _GLOB_MAGIC_CHARS.search(pattern, 1):
+        # Patterns like "*.txt" only need to check the end of the path.
+        suffix = pattern[1:]
+
+        def _glob_fn(path: str) -> bool:
+            return os.path.normcase(path).endswith(suffix)
+
+    else:
+        # Same as fnmatch.fnmatch() but with the pattern compiled once instead of looked up from
+        # fnmatch's cache for every path.
+        match = re.compile(fnmatch.translate(pattern)).match
+
+        def _glob_fn(path: str) -> bool:
+            return match(os.path.normcase(path)) is not None
+
+    return _glob_fn
+
+
 @contextmanager
 def cd(path: StrPath) -> t.Iterator[None]:
     """
@@ -222,6 +471,8 @@ def ls(
     only_dirs: bool = False,
     include: t.Optional[LsFilter] = None,
     exclude: t.Optional[LsFilter] = None,
+    workers: int = 1,
+    visit_once: bool = False,
 ) -> Ls:
     """
     Return iterable that lists directory contents as ``Path`` objects.
@@ -240,6 +491,13 @@ def ls(
             iterable containing any of those types. Path is not yielded if any of the filters return
             ``True``. If the path is a directory and is excluded, then all of its contents will be
             excluded.
+        workers: Number of threads to scan directories with when recursive. Directories are
+            scanned concurrently when greater than ``1`` in which case paths are not listed in
+            depth-first order and `include` and `exclude` filters are called from the worker
+            threads so callable filters must be thread-safe. Defaults to ``1``.
+        visit_once: Whether to only walk directories that are reachable from more than one path
+            (e.g. through bind mounts) once when recursive. Each subdirectory is ``lstat``'d to
+            identify it when enabled. Defaults to ``False``.
     """
     return Ls(
         path,
@@ -248,6 +506,8 @@ def ls(
         only_dirs=only_dirs,
         include=include,
         exclude=exclude,
+        workers=workers,
+        visit_once=visit_once,
     )
 
 
@@ -314,7 +574,9 @@ def reljoin(*paths: StrPath) -> str:
     Args:
         *paths: Paths to join together.
     """
-    path = os.sep.join(str(Path(path)) for path in paths)
+    # Empty paths are treated as the current directory like Path() does so that a leading empty path
+    # doesn't make the joined path absolute.
+    path = os.sep.join(os.fspath(path) or os.curdir for path in paths)
     return os.path.normpath(path)
 
 
@@ -325,6 +587,8 @@ def walk(
     only_dirs: bool = False,
     include: t.Optional[LsFilter] = None,
     exclude: t.Optional[LsFilter] = None,
+    workers: int = 1,
+    visit_once: bool = False,
 ) -> Ls:
     """
     Return iterable that recursively lists all directory contents as ``Path`` objects.
@@ -346,6 +610,13 @@ def walk(
             iterable containing any of those types. Path is not yielded if any of the filters return
             ``True``. If the path is a directory and is excluded, then all of its contents will be
             excluded.
+        workers: Number of threads to scan directories with. Directories are scanned concurrently
+            when greater than ``1`` in which case paths are not listed in depth-first order and
+            `include` and `exclude` filters are called from the worker threads so callable filters
+            must be thread-safe. Defaults to ``1``.
+        visit_once: Whether to only walk directories that are reachable from more than one path
+            (e.g. through bind mounts) once. Each subdirectory is ``lstat``'d to identify it when
+            enabled. Defaults to ``False``.
     """
     return ls(
         path,
@@ -354,6 +625,8 @@ def walk(
         only_dirs=only_dirs,
         include=include,
         exclude=exclude,
+        workers=workers,
+        visit_once=visit_once,
     )
 
 
@@ -362,6 +635,8 @@ def walkfiles(
     *,
     include: t.Optional[LsFilter] = None,
     exclude: t.Optional[LsFilter] = None,
+    workers: int = 1,
+    visit_once: bool = False,
 ) -> Ls:
     """
     Return iterable that recursively lists only files in directory as ``Path`` objects.
@@ -380,8 +655,22 @@ def walkfiles(
             iterable containing any of those types. Path is not yielded if any of the filters return
             ``True``. If the path is a directory and is excluded, then all of its contents will be
             excluded.
+        workers: Number of threads to scan directories with. Directories are scanned concurrently
+            when greater than ``1`` in which case paths are not listed in depth-first order and
+            `include` and `exclude` filters are called from the worker threads so callable filters
+            must be thread-safe. Defaults to ``1``.
+        visit_once: Whether to only walk directories that are reachable from more than one path
+            (e.g. through bind mounts) once. Each subdirectory is ``lstat``'d to identify it when
+            enabled. Defaults to ``False``.
     """
-    return walk(path, only_files=True, include=include, exclude=exclude)
+    return walk(
+        path,
+        only_files=True,
+        include=include,
+        exclude=exclude,
+        workers=workers,
+        visit_once=visit_once,
+    )
 
 
 def walkdirs(
@@ -389,6 +678,8 @@ def walkdirs(
     *,
     include: t.Optional[LsFilter] = None,
     exclude: t.Optional[LsFilter] = None,
+    workers: int = 1,
+    visit_once: bool = False,
 ) -> Ls:
     """
     Return iterable that recursively lists only directories in directory as ``Path`` objects.
@@ -407,5 +698,19 @@ def walkdirs(
             iterable containing any of those types. Path is not yielded if any of the filters return
             ``True``. If the path is a directory and is excluded, then all of its contents will be
             excluded.
+        workers: Number of threads to scan directories with. Directories are scanned concurrently
+            when greater than ``1`` in which case paths are not listed in depth-first order and
+            `include` and `exclude` filters are called from the worker threads so callable filters
+            must be thread-safe. Defaults to ``1``.
+        visit_once: Whether to only walk directories that are reachable from more than one path
+            (e.g. through bind mounts) once. Each subdirectory is ``lstat``'d to identify it when
+            enabled. Defaults to ``False``.
     """
-    return walk(path, only_dirs=True, include=include, exclude=exclude)
+    return walk(
+        path,
+        only_dirs=True,
+        include=include,
+        exclude=exclude,
+        workers=workers,
+        visit_once=visit_once,
+    )
@@ -32,9 +32,10 @@ ReadOnlyBinMode = Literal["rb", "br"]
 WriteOnlyTextMode = Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"]
 WriteOnlyBinMode = Literal["wb", "bw", "ab", "ba", "xb", "bx"]
 
-READ_ONLY_TEXT_MODES = _get_literal_args(ReadOnlyTextMode)
-READ_ONLY_BIN_MODES = _get_literal_args(ReadOnlyBinMode)
-READ_ONLY_MODES = READ_ONLY_TEXT_MODES + READ_ONLY_BIN_MODES
-WRITE_ONLY_TEXT_MODES = _get_literal_args(WriteOnlyTextMode)
-WRITE_ONLY_BIN_MODES = _get_literal_args(WriteOnlyBinMode)
-WRITE_ONLY_MODES = WRITE_ONLY_TEXT_MODES + WRITE_ONLY_BIN_MODES
+# Modes are frozensets since they are only used for membership checks on every read/write call.
+READ_ONLY_TEXT_MODES = frozenset(_get_literal_args(ReadOnlyTextMode))
+READ_ONLY_BIN_MODES = frozenset(_get_literal_args(ReadOnlyBinMode))
+READ_ONLY_MODES = READ_ONLY_TEXT_MODES | READ_ONLY_BIN_MODES
+WRITE_ONLY_TEXT_MODES = frozenset(_get_literal_args(WriteOnlyTextMode))
+WRITE_ONLY_BIN_MODES = frozenset(_get_literal_args(WriteOnlyBinMode))
+WRITE_ONLY_MODES = WRITE_ONLY_TEXT_MODES | WRITE_ONLY_BIN_MODES
@@ -1,5 +1,6 @@
 from pathlib import Path
 import typing as t
+from unittest import mock
 
 import pytest
 from pytest import param
@@ -49,6 +50,15 @@ def test_atomicdir(tmp_path: Path, opts: t.Dict[str, t.Any]):
         assert file.path.read_text() == file.text
 
 
+def test_atomicdir__accepts_relative_path(tmp_path: Path):
+    with sh.cd(tmp_path):
+        with sh.atomicdir("test") as stage_path:
+            assert stage_path.parent == tmp_path
+            (stage_path / "1.txt").write_text("1")
+
+    assert (tmp_path / "test" / "1.txt").read_text() == "1"
+
+
 def test_atomicdir__syncs_dir(tmp_path: Path):
     dir = tmp_path / "test"
 
@@ -80,6 +90,18 @@ def test_atomicdir__overwrites_when_enabled(tmp_path: Path):
         pass
 
     assert not list(dir.path.iterdir())
+    assert list(tmp_path.iterdir()) == [dir.path]
+
+
+def test_atomicdir__overwrites_file_created_while_staging(tmp_path: Path):
+    dir = tmp_path / "test"
+
+    with sh.atomicdir(dir) as stage_path:
+        (stage_path / "1.txt").write_text("1")
+        dir.write_text("")
+
+    assert (dir / "1.txt").read_text() == "1"
+    assert list(tmp_path.iterdir()) == [dir]
 
 
 def test_atomicdir__does_not_overwrite_when_disabled(tmp_path: Path):
@@ -91,6 +113,19 @@ def test_atomicdir__does_not_overwrite_when_disabled(tmp_path: Path):
             pass
 
 
+def test_atomicdir__removes_temp_dir_on_error(tmp_path: Path):
+    dir = tmp_path / "test"
+
+    with pytest.raises(RuntimeError):
+        with sh.atomicdir(dir) as stage_path:
+            (stage_path / "1.txt").write_text("1")
+            raise RuntimeError
+
+    assert not stage_path.exists()
+    assert not dir.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_atomicdir__fails_if_path_is_file(tmp_path: Path):
     already_exists_file = tmp_path / "test"
     already_exists_file.write_text("")
@@ -122,6 +157,14 @@ def test_atomicfile(tmp_path: Path, opts: t.Dict[str, t.Any]):
     assert file.read_text() == text
 
 
+def test_atomicfile__accepts_relative_path(tmp_path: Path):
+    with sh.cd(tmp_path):
+        with sh.atomicfile("sub/test.txt") as fp:
+            fp.write("test")
+
+    assert (tmp_path / "sub" / "test.txt").read_text() == "test"
+
+
 def test_atomicfile__syncs_new_file_and_dir(tmp_path: Path):
     file = tmp_path / "test.txt"
 
@@ -152,6 +195,29 @@ def test_atomicfile__does_not_overwrite_when_disabled(tmp_path: Path):
             pass
 
 
+@parametrize(
+    "opts",
+    [
+        param({}),
+        param({"overwrite": False}),
+    ],
+)
+def test_atomicfile__leaves_no_temp_file(tmp_path: Path, opts: t.Dict[str, t.Any]):
+    file = tmp_path / "test.txt"
+
+    with sh.atomicfile(file, **opts) as fp:
+        fp.write("test")
+
+    assert list(tmp_path.iterdir()) == [file]
+
+    with pytest.raises(RuntimeError):
+        with sh.atomicfile(tmp_path / "error.txt", **opts) as fp:
+            fp.write("test")
+            raise RuntimeError
+
+    assert list(tmp_path.iterdir()) == [file]
+
+
 def test_atomicfile__fails_if_path_is_dir(tmp_path: Path):
     already_exists_dir = tmp_path
     with pytest.raises(IsADirectoryError):
@@ -185,3 +251,97 @@ def test_atomicfile__raises_when_mode_invalid(tmp_path: Path, mode: t.Any):
     with pytest.raises(ValueError):
         with sh.atomicfile(tmp_path / "test.txt", mode):
             pass
+
+
+def test_atomicgroup__defers_dirsync_until_exit(tmp_path: Path):
+    dir1 = tmp_path / "one"
+    dir2 = tmp_path / "two"
+
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        with sh.atomicgroup():
+            for dir in (dir1, dir2):
+                for name in ("1.txt", "2.txt", "3.txt"):
+                    with sh.atomicfile(dir / name) as fp:
+                        fp.write(name)
+            assert not mocked_dirsync.called
+
+    assert mocked_dirsync.call_args_list == [mock.call(str(dir1)), mock.call(str(dir2))]
+    assert sorted(path.name for path in dir1.iterdir()) == ["1.txt", "2.txt", "3.txt"]
+    assert sorted(path.name for path in dir2.iterdir()) == ["1.txt", "2.txt", "3.txt"]
+
+
+def test_atomicgroup__merges_nested_groups(tmp_path: Path):
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        with sh.atomicgroup():
+            with sh.atomicgroup():
+                sh.write(tmp_path / "1.txt", "1", atomic=True)
+            assert not mocked_dirsync.called
+            sh.write(tmp_path / "2.txt", "2", atomic=True)
+
+    assert mocked_dirsync.call_args_list == [mock.call(str(tmp_path))]
+
+
+def test_atomicgroup__syncs_on_error(tmp_path: Path):
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        with pytest.raises(RuntimeError):
+            with sh.atomicgroup():
+                sh.write(tmp_path / "1.txt", "1", atomic=True)
+                raise RuntimeError
+
+    assert mocked_dirsync.call_args_list == [mock.call(str(tmp_path))]
+
+
+def test_atomicgroup__skips_sync_when_disabled(tmp_path: Path):
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        with sh.atomicgroup():
+            with sh.atomicfile(tmp_path / "1.txt", skip_sync=True) as fp:
+                fp.write("1")
+
+    assert not mocked_dirsync.called
+
+
+def test_atomicgroup__defers_atomicdir_dirsync_until_exit(tmp_path: Path):
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        with sh.atomicgroup():
+            for name in ("a", "b", "c"):
+                with sh.atomicdir(tmp_path / name) as stage_path:
+                    (stage_path / "1.txt").write_text("1")
+            staged_calls = mocked_dirsync.call_args_list[:]
+
+    assert str(tmp_path) not in [call[0][0] for call in staged_calls]
+    assert mocked_dirsync.call_args_list == staged_calls + [mock.call(str(tmp_path))]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a", "b", "c"]
+
+
+def test_atomicfile__does_not_reuse_existing_temp_file(tmp_path: Path):
+    file = tmp_path / "test.txt"
+    taken = tmp_path / ".test.txt_taken.tmp"
+    taken.write_text("taken")
+
+    with mock.patch(
+        "shelmet.filesystem._random_name",
+        side_effect=[f"{file}_taken.tmp", f"{file}_free.tmp"],
+    ):
+        with sh.atomicfile(file) as fp:
+            assert fp.name == str(tmp_path / ".test.txt_free.tmp")
+            fp.write("test")
+
+    assert taken.read_text() == "taken"
+    assert file.read_text() == "test"
+
+
+def test_atomicdir__does_not_reuse_existing_temp_dir(tmp_path: Path):
+    dir = tmp_path / "test"
+    taken = tmp_path / ".test_taken_tmp"
+    taken.mkdir()
+    (taken / "1.txt").write_text("taken")
+
+    with mock.patch(
+        "shelmet.filesystem._random_name",
+        side_effect=[f"{dir}_taken_tmp", f"{dir}_free_tmp"],
+    ):
+        with sh.atomicdir(dir) as stage_path:
+            assert stage_path == tmp_path / ".test_free_tmp"
+
+    assert (taken / "1.txt").read_text() == "taken"
+    assert dir.is_dir()
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 import re
 import typing as t
+from unittest import mock
 
 import pytest
 from pytest import param
@@ -117,6 +118,25 @@ def test_backup__appends_utc_timestamp_using_strftime(freezer, src_file: Path):
     assert backup_file.name == expected_name
 
 
+@parametrize(
+    "now",
+    [
+        param(datetime(2021, 2, 24, 16, 19, 20, 276491)),
+        param(datetime(2021, 2, 24, 16, 19, 20)),
+        param(datetime(2021, 2, 24, 16, 19, 20, 276491, timezone.utc)),
+        param(datetime(2021, 2, 24, 16, 19, 20, 0, timezone.utc)),
+    ],
+)
+def test_backup__formats_default_timestamp_like_strftime(src_file: Path, now: datetime):
+    expected_name = f"{src_file.name}.{now.strftime(DEFAULT_TS_FORMAT)}~"
+
+    with mock.patch("shelmet.archiving.datetime") as mocked_datetime:
+        mocked_datetime.now.return_value = now
+        backup_file = sh.backup(src_file, utc=now.tzinfo is not None)
+
+    assert backup_file.name == expected_name
+
+
 @parametrize(
     "filename, args, pattern",
     [
@@ -185,3 +205,55 @@ def test_backup__raises_when_destination_exists(src_file):
     dst.touch()
     with pytest.raises(FileExistsError):
         sh.backup(src_file, suffix="~", timestamp=None)
+
+
+@parametrize(
+    "resolve, expected_parent",
+    [
+        param(False, "links"),
+        param(True, "files"),
+    ],
+)
+def test_backup__resolves_symlinks_when_enabled(
+    tmp_path: Path, resolve: bool, expected_parent: str
+):
+    src_file = tmp_path / "files" / "test.txt"
+    src_file.parent.mkdir()
+    src_file.write_text("test")
+    src_link = tmp_path / "links" / "test.txt"
+    src_link.parent.mkdir()
+    src_link.symlink_to(src_file)
+
+    backup_file = sh.backup(src_link, resolve=resolve)
+
+    assert backup_file.parent.resolve() == (tmp_path / expected_parent).resolve()
+    assert backup_file.read_text() == "test"
+
+
+@parametrize("resolve", [param(False), param(True)])
+def test_backup__resolves_symlinks_in_dir_and_namer_paths_when_enabled(
+    tmp_path: Path, resolve: bool
+):
+    files_dir = tmp_path / "files"
+    files_dir.mkdir()
+    src_file = files_dir / "test.txt"
+    src_file.write_text("test")
+    src_link = tmp_path / "test.txt"
+    src_link.symlink_to(src_file)
+    backups_dir = tmp_path / "backups"
+    backups_dir.mkdir()
+    backups_link = tmp_path / "backups_link"
+    backups_link.symlink_to(backups_dir)
+
+    dir_backup = sh.backup(src_link, dir=backups_link, timestamp=None, resolve=resolve)
+    named_backup = sh.backup(
+        src_link, namer=lambda src: backups_link / f"{src.name}.named", resolve=resolve
+    )
+
+    if resolve:
+        assert dir_backup == backups_dir.resolve() / "test.txt~"
+        assert named_backup == backups_dir.resolve() / "test.txt.named"
+    else:
+        assert dir_backup == backups_link / "test.txt~"
+        assert named_backup == backups_link / "test.txt.named"
+    assert dir_backup.read_text() == named_backup.read_text() == "test"
@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
 import stat
 import typing as t
+from unittest import mock
 
 import pytest
 from pytest import param
@@ -88,6 +90,22 @@ def test_chmod__sets_file_mode(
     assert filemode == expected_mode
 
 
+def test_chmod__applies_same_symbolic_mode_to_different_modes(tmp_path: Path):
+    expected_modes = {0o777: "-rwxr-xr-x", 0o600: "-rwx------", 0o644: "-rwxr--r--"}
+    files = []
+    for starting_mode in expected_modes:
+        file = tmp_path / oct(starting_mode)
+        file.touch()
+        file.chmod(starting_mode)
+        files.append(file)
+
+    for file in files:
+        sh.chmod(file, "go-w,u+x")
+
+    filemodes = [stat.filemode(file.stat().st_mode) for file in files]
+    assert filemodes == list(expected_modes.values())
+
+
 def test_chmod__sets_dir_mode(test_dir: Path):
     sh.chmod(test_dir, "+rw")
 
@@ -164,6 +182,53 @@ def test_chmod__recursively_sets_mode(
         ), f"Expected mode of {path} to be {expected_mode!r}, not {path_mode!r}"
 
 
+def test_chmod__recursively_does_not_walk_into_symlinked_dirs(tmp_path: Path):
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "1.txt").touch()
+    linked_dir = tmp_path / "linked_dir"
+    linked_dir.mkdir()
+    linked_file = linked_dir / "2.txt"
+    linked_file.touch()
+    linked_file.chmod(0o644)
+    (test_dir / "link").symlink_to(linked_dir)
+
+    sh.chmod(test_dir, "go-rwx", recursive=True)
+
+    assert stat.filemode((test_dir / "1.txt").stat().st_mode) == "-rw-------"
+    assert stat.filemode(linked_file.stat().st_mode) == "-rw-r--r--"
+
+
+def test_chmod__recursively_walks_symlinked_top_dir(tmp_path: Path):
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    test_file = test_dir / "1.txt"
+    test_file.touch()
+    test_file.chmod(0o644)
+    link = tmp_path / "link"
+    link.symlink_to(test_dir)
+
+    sh.chmod(link, 0o700, recursive=True)
+
+    assert stat.S_IMODE(test_file.stat().st_mode) == 0o700
+
+
+def test_chmod__recursively_raises_when_subdir_is_unreadable(tmp_path: Path):
+    test_dir = tmp_path / "test_dir"
+    (test_dir / "unreadable").mkdir(parents=True)
+    (test_dir / "unreadable" / "1.txt").touch()
+    os_open = os.open
+
+    def mock_open(path, *args, **kwargs):
+        if path == "unreadable":
+            raise PermissionError(path)
+        return os_open(path, *args, **kwargs)
+
+    with mock.patch("os.open", side_effect=mock_open):
+        with pytest.raises(PermissionError):
+            sh.chmod(test_dir, 0o700, recursive=True)
+
+
 @parametrize(
     "mode, exception",
     [
@@ -106,10 +106,52 @@ def test_chown__changes_ownership_recursively(tmp_path: Path, mock_os_chown: moc
     )
     test_dir.mkdir()
 
+    chowned = []
+
+    def record_chown(path, uid, gid, *, dir_fd=None, follow_symlinks=True):
+        # Identify sub-paths by their parent directory's inode since they are chowned relative to an
+        # open directory file descriptor.
+        parent_ino = os.fstat(dir_fd).st_ino if dir_fd is not None else None
+        chowned.append((parent_ino, str(path), uid, gid, follow_symlinks))
+
+    mock_os_chown.side_effect = record_chown
     sh.chown(test_dir.path, user=1, group=2, recursive=True)
 
-    for path in (test_dir.path, *sh.walk(test_dir.path)):
-        assert chown_call(path, user=1, group=2) in mock_os_chown.call_args_list
+    expected = [(None, str(test_dir.path), 1, 2, True)]
+    for path in sh.walk(test_dir.path):
+        expected.append((path.parent.stat().st_ino, path.name, 1, 2, True))
+    assert sorted(chowned, key=str) == sorted(expected, key=str)
+
+
+def test_chown__changes_ownership_recursively_through_symlinked_top_dir(
+    tmp_path: Path, mock_os_chown: mock.MagicMock
+):
+    test_dir = Dir(tmp_path / "test_dir", File("1.txt"), Dir("a", File("2.txt")))
+    test_dir.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(test_dir.path)
+
+    sh.chown(link, user=1, group=2, recursive=True)
+
+    chowned = {call[0][0] for call in mock_os_chown.call_args_list}
+    assert chowned == {link, "1.txt", "a", "2.txt"}
+
+
+def test_chown__recursively_raises_when_subdir_is_unreadable(
+    tmp_path: Path, mock_os_chown: mock.MagicMock
+):
+    test_dir = Dir(tmp_path / "test_dir", Dir("unreadable", File("1.txt")))
+    test_dir.mkdir()
+    os_open = os.open
+
+    def mock_open(path, *args, **kwargs):
+        if path == "unreadable":
+            raise PermissionError(path)
+        return os_open(path, *args, **kwargs)
+
+    with mock.patch("os.open", side_effect=mock_open):
+        with pytest.raises(PermissionError):
+            sh.chown(test_dir.path, user=1, group=2, recursive=True)
 
 
 def test_chown__raises_when_missing_user_and_group():
@@ -125,3 +167,38 @@ def test_chown__raises_when_user_name_invalid():
 def test_chown__raises_when_group_name_invalid():
     with pytest.raises(LookupError):
         sh.chown("path", group=uuid4().hex)
+
+
+def test_chown__caches_user_and_group_name_lookups(
+    tmp_path: Path,
+    mock_os_chown: mock.MagicMock,
+    os_user: pwd.struct_passwd,
+    os_group: grp.struct_group,
+):
+    sh.filesystem._lookup_uid.cache_clear()
+    sh.filesystem._lookup_gid.cache_clear()
+
+    with mock.patch("shelmet.filesystem.getpwnam", wraps=pwd.getpwnam) as mocked_getpwnam:
+        with mock.patch("shelmet.filesystem.getgrnam", wraps=grp.getgrnam) as mocked_getgrnam:
+            for _ in range(3):
+                sh.chown(tmp_path, user=os_user.pw_name, group=os_group.gr_name)
+
+    assert mocked_getpwnam.call_count == 1
+    assert mocked_getgrnam.call_count == 1
+    assert mock_os_chown.call_args == chown_call(
+        tmp_path, user=os_user.pw_uid, group=os_group.gr_gid
+    )
+
+
+def test_chown__does_not_cache_unknown_user_name(tmp_path: Path, mock_os_chown: mock.MagicMock):
+    name = uuid4().hex
+
+    with pytest.raises(LookupError):
+        sh.chown(tmp_path, user=name)
+
+    with mock.patch("shelmet.filesystem.getpwnam") as mocked_getpwnam:
+        mocked_getpwnam.return_value.pw_uid = 1000
+        sh.chown(tmp_path, user=name)
+
+    assert mock_os_chown.call_args == chown_call(tmp_path, user=1000)
+    sh.filesystem._lookup_uid.cache_clear()
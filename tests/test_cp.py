@@ -1,4 +1,8 @@
+import errno
+import os
 from pathlib import Path
+import shutil
+from unittest import mock
 
 import pytest
 
@@ -45,6 +49,21 @@ def test_cp__copies_file_to_existing_dir(tmp_path: Path):
     assert dst_file.read_text() == src_file.text
 
 
+def test_cp__copies_file_symlink_when_not_following_symlinks(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    src_link = tmp_path / "link.txt"
+    src_link.symlink_to(src_file)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+
+    sh.cp(src_link, dst_dir, follow_symlinks=False)
+
+    dst_link = dst_dir / "link.txt"
+    assert dst_link.is_symlink()
+    assert dst_link.read_text() == "test"
+
+
 def test_cp__copies_dir_to_new_dir(tmp_path: Path):
     src_dir = Dir(
         tmp_path / "src",
@@ -91,3 +110,235 @@ def test_cp__copies_and_merge_dir_to_existing_dir(tmp_path: Path):
     for file in all_files:
         assert file.path.is_file()
         assert file.path.read_text() == file.text
+
+
+def test_cp__merges_new_subdirs_into_existing_dir(tmp_path: Path):
+    src_dir = Dir(
+        tmp_path / "src",
+        File("a/b/c/1.txt", text="1"),
+        File("a/b/c/2.txt", text="2"),
+        File("x/y.txt", text="y"),
+    )
+    src_dir.mkdir()
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+
+    with mock.patch("os.makedirs", wraps=os.makedirs) as mocked_makedirs, mock.patch(
+        "os.mkdir", wraps=os.mkdir
+    ) as mocked_mkdir:
+        sh.cp(src_dir.path, dst_path)
+
+    for file in src_dir.repath(dst_path).files:
+        assert file.path.read_text() == file.text
+
+    assert not mocked_makedirs.called
+    made_dirs = [call[0][0] for call in mocked_mkdir.call_args_list]
+    assert sorted(made_dirs) == sorted(
+        str(dst_path / path) for path in ("a", "a/b", "a/b/c", "x")
+    )
+
+
+def test_cp__raises_when_merging_dir_onto_nested_file(tmp_path: Path):
+    src_dir = Dir(tmp_path / "src", File("a/1.txt", text="1"))
+    src_dir.mkdir()
+    dst_dir = Dir(tmp_path / "dst", File("a", text="a"))
+    dst_dir.mkdir()
+
+    with pytest.raises(FileExistsError):
+        sh.cp(src_dir.path, dst_dir.path)
+
+
+def test_cp__replaces_existing_file_with_symlink(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    src_link = tmp_path / "link.txt"
+    src_link.symlink_to(src_file)
+    dst_file = tmp_path / "dst.txt"
+    dst_file.write_text("old")
+
+    sh.cp(src_link, dst_file, follow_symlinks=False)
+
+    assert dst_file.is_symlink()
+    assert os.readlink(dst_file) == str(src_file)
+    assert sorted(tmp_path.iterdir()) == [dst_file, src_link, src_file]
+
+
+def test_cp__replaces_existing_symlink_instead_of_writing_through_it(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    target_file = tmp_path / "target.txt"
+    target_file.write_text("target")
+    dst_link = tmp_path / "dst.txt"
+    dst_link.symlink_to(target_file)
+
+    sh.cp(src_file, dst_link)
+
+    assert not dst_link.is_symlink()
+    assert dst_link.read_text() == "test"
+    assert target_file.read_text() == "target"
+
+
+def test_cp__replaces_read_only_destination(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    src_file.chmod(0o644)
+    dst_file = tmp_path / "dst.txt"
+    dst_file.write_text("old")
+    dst_file.chmod(0o444)
+    dst_ino = dst_file.stat().st_ino
+
+    sh.cp(src_file, dst_file)
+
+    assert dst_file.read_text() == "test"
+    assert dst_file.stat().st_ino != dst_ino
+    assert sorted(tmp_path.iterdir()) == [dst_file, src_file]
+
+
+def test_cp__replaces_hardlinked_destination_without_changing_other_links(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    dst_file = tmp_path / "dst.txt"
+    dst_file.write_text("old")
+    other_link = tmp_path / "other.txt"
+    os.link(dst_file, other_link)
+
+    sh.cp(src_file, dst_file)
+
+    assert dst_file.read_text() == "test"
+    assert other_link.read_text() == "old"
+    assert sorted(tmp_path.iterdir()) == [dst_file, other_link, src_file]
+
+
+def test_cp__copies_dir_with_symlinks_again_when_not_following_symlinks(tmp_path: Path):
+    src_dir = Dir(tmp_path / "src", File("a.txt", text="a"), File("b/b.txt", text="b"))
+    src_dir.mkdir()
+    (src_dir.path / "link.txt").symlink_to(src_dir.path / "a.txt")
+    (src_dir.path / "b" / "link.txt").symlink_to(src_dir.path / "b" / "b.txt")
+    dst_dir = tmp_path / "dst"
+
+    sh.cp(src_dir.path, dst_dir, follow_symlinks=False)
+    sh.cp(src_dir.path, dst_dir, follow_symlinks=False)
+
+    assert (dst_dir / "link.txt").is_symlink()
+    assert os.readlink(dst_dir / "link.txt") == str(src_dir.path / "a.txt")
+    assert (dst_dir / "b" / "link.txt").is_symlink()
+    assert (dst_dir / "b" / "link.txt").read_text() == "b"
+    assert sorted(path.name for path in dst_dir.iterdir()) == ["a.txt", "b", "link.txt"]
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+def test_cp__copies_file_contents_and_metadata_in_kernel(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_bytes(os.urandom(1024 * 1024 + 1))
+    src_file.chmod(0o640)
+    os.utime(src_file, (1000000000, 1000000000))
+    dst_file = tmp_path / "dst.txt"
+
+    with mock.patch("os.copy_file_range", wraps=os.copy_file_range) as mocked_copy_file_range:
+        sh.cp(src_file, dst_file)
+
+    assert mocked_copy_file_range.called
+    assert dst_file.read_bytes() == src_file.read_bytes()
+    assert dst_file.stat().st_mode == src_file.stat().st_mode
+    assert dst_file.stat().st_mtime == src_file.stat().st_mtime
+    assert sorted(tmp_path.iterdir()) == [dst_file, src_file]
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+def test_cp__falls_back_when_copy_file_range_unsupported(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    dst_file = tmp_path / "dst.txt"
+
+    with mock.patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "")):
+        sh.cp(src_file, dst_file)
+
+    assert dst_file.read_text() == "test"
+    assert sorted(tmp_path.iterdir()) == [dst_file, src_file]
+
+
+def test_cp__copies_file_directly_by_default(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    dst_file = tmp_path / "dst.txt"
+
+    with mock.patch("os.replace", wraps=os.replace) as mocked_os_replace:
+        sh.cp(src_file, dst_file)
+
+    assert not mocked_os_replace.called
+    assert dst_file.read_text() == "test"
+
+
+def test_cp__copies_file_atomically_when_enabled(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    dst_file = tmp_path / "dst.txt"
+    dst_file.write_text("old")
+
+    with mock.patch("os.replace", wraps=os.replace) as mocked_os_replace:
+        sh.cp(src_file, dst_file, atomic=True)
+
+    assert mocked_os_replace.call_count == 1
+    tmp_dst, renamed_dst = mocked_os_replace.call_args[0]
+    assert Path(tmp_dst).parent == tmp_path
+    assert renamed_dst == str(dst_file)
+    assert dst_file.read_text() == "test"
+    assert sorted(tmp_path.iterdir()) == [dst_file, src_file]
+
+
+@pytest.mark.parametrize("dst_exists", [False, True])
+def test_cp__copies_symlink_atomically(tmp_path: Path, dst_exists: bool):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    src_link = tmp_path / "link.txt"
+    src_link.symlink_to(src_file)
+    dst_link = tmp_path / "dst.txt"
+    if dst_exists:
+        dst_link.write_text("old")
+
+    sh.cp(src_link, dst_link, follow_symlinks=False, atomic=True)
+
+    assert dst_link.is_symlink()
+    assert os.readlink(dst_link) == str(src_file)
+    assert sorted(tmp_path.iterdir()) == [dst_link, src_link, src_file]
+
+
+def test_cp__does_not_reuse_existing_temp_file_when_atomic(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+    dst_file = tmp_path / "dst.txt"
+    taken = tmp_path / ".dst.txt_taken"
+    taken.write_text("taken")
+
+    with mock.patch(
+        "shelmet.filesystem._random_name",
+        side_effect=[f"{dst_file}_taken", f"{dst_file}_free"],
+    ):
+        sh.cp(src_file, dst_file, atomic=True)
+
+    assert taken.read_text() == "taken"
+    assert dst_file.read_text() == "test"
+    assert sorted(tmp_path.iterdir()) == [taken, dst_file, src_file]
+
+
+def test_cp__raises_when_copying_file_to_itself(tmp_path: Path):
+    src_file = tmp_path / "src.txt"
+    src_file.write_text("test")
+
+    with pytest.raises(shutil.SameFileError):
+        sh.cp(src_file, src_file)
+
+    assert src_file.read_text() == "test"
+
+
+def test_cp__merges_empty_subdirs_into_existing_dir(tmp_path: Path):
+    src_dir = Dir(tmp_path / "src", Dir("a"), Dir("b/c"), File("b/1.txt", text="1"))
+    src_dir.mkdir()
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+
+    sh.cp(src_dir.path, dst_path)
+
+    assert (dst_path / "a").is_dir()
+    assert (dst_path / "b" / "c").is_dir()
+    assert (dst_path / "b" / "1.txt").read_text() == "1"
@@ -42,3 +42,17 @@ def test_environ__replaces_envvars_and_restores_original(env: dict):
         assert env == envvars
         assert env == os.environ
     assert os.environ == orig_env
+
+
+def test_environ__restores_envvars_changed_inside_context():
+    orig_env = os.environ.copy()
+    os.environ["SHELMET_TEST_DELETED"] = "1"
+    try:
+        with sh.environ({"a": "1"}):
+            os.environ["SHELMET_TEST_ADDED"] = "1"
+            del os.environ["SHELMET_TEST_DELETED"]
+            os.environ["a"] = "2"
+        assert os.environ == {**orig_env, "SHELMET_TEST_DELETED": "1"}
+    finally:
+        os.environ.pop("SHELMET_TEST_DELETED", None)
+
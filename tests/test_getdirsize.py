@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 import typing as t
+from unittest import mock
 
 import pytest
 from pytest import param
@@ -63,3 +65,42 @@ def test_getdirsize(
     if pattern:
         kwargs["pattern"] = pattern
     assert sh.getdirsize(tmp_path, **kwargs) == expected_size
+
+
+def test_getdirsize__matches_glob_with_hidden_files_and_symlinks(tmp_path: Path):
+    Dir(tmp_path, File("a/b/1", size=10), File(".2", size=5), File("a/.c/3", size=7)).mkdir()
+    (tmp_path / "dir_link").symlink_to(tmp_path / "a")
+    (tmp_path / "file_link").symlink_to(tmp_path / "a" / "b" / "1")
+    (tmp_path / "broken_link").symlink_to(tmp_path / "missing")
+
+    expected_size = sum(item.stat().st_size for item in tmp_path.glob("**/*") if item.is_file())
+
+    assert sh.getdirsize(tmp_path) == expected_size == 32
+
+
+@parametrize(
+    "path",
+    [
+        param("missing", id="missing"),
+        param("a/1", id="file"),
+    ],
+)
+def test_getdirsize__returns_zero_when_path_is_not_a_dir(tmp_path: Path, path: str):
+    Dir(tmp_path, File("a/1", size=10)).mkdir()
+
+    assert sh.getdirsize(tmp_path / path) == 0
+    assert sh.getdirsize(tmp_path / path, pattern="**/1") == 0
+
+
+def test_getdirsize__skips_unreadable_dirs(tmp_path: Path):
+    Dir(tmp_path, File("a/1", size=10), File("b/2", size=5), File("3", size=7)).mkdir()
+    unreadable_dir = str(tmp_path / "a")
+    scandir = os.scandir
+
+    def mock_scandir(path):
+        if path == unreadable_dir:
+            raise PermissionError(path)
+        return scandir(path)
+
+    with mock.patch("os.scandir", side_effect=mock_scandir):
+        assert sh.getdirsize(tmp_path) == 12
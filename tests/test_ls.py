@@ -1,6 +1,8 @@
 import fnmatch
+import os
 from pathlib import Path
 import re
+import threading
 import typing as t
 from unittest import mock
 
@@ -306,6 +308,248 @@ def test_ls__does_not_recurse_into_excluded_dirs(tmp_path: Path):
     assert contents == expected_contents
 
 
+@parametrize(
+    "pattern",
+    [
+        param("a.txt", id="literal"),
+        param("x/a.txt", id="literal_nested"),
+        param("*.txt", id="suffix"),
+        param("*a.txt", id="suffix_with_name"),
+        param("x/*", id="prefix"),
+        param("*/?.txt", id="glob"),
+        param("*[ab].log", id="glob_chars"),
+    ],
+)
+def test_ls__matches_str_filters_like_fnmatch(tmp_path: Path, pattern: str):
+    src = Dir(
+        tmp_path,
+        Dir("x", File("a.txt"), File("b.log"), File("ca.txt")),
+        File("a.txt"),
+        File("a.log"),
+        File("b.txt"),
+    )
+    src.mkdir()
+
+    with sh.cd(tmp_path):
+        expected = {path for path in sh.walk("") if fnmatch.fnmatch(str(path), pattern)}
+        contents = set(sh.walk("", include=pattern))
+
+    assert expected
+    assert contents == expected
+
+
+@parametrize(
+    "patterns",
+    [
+        param(["a.txt", "*.log"]),
+        param(["x/*", "*a.txt", "b.txt"]),
+        param(["*/?.txt", re.compile(r".*\.log$"), "*[ab].txt", lambda path: path.name == "c"]),
+    ],
+)
+def test_ls__matches_any_of_multiple_str_filters(tmp_path: Path, patterns: list):
+    src = Dir(
+        tmp_path,
+        Dir("x", File("a.txt"), File("b.log"), File("ca.txt")),
+        Dir("c"),
+        File("a.txt"),
+        File("a.log"),
+        File("b.txt"),
+    )
+    src.mkdir()
+
+    def matches(path: Path) -> bool:
+        for pattern in patterns:
+            if isinstance(pattern, str):
+                matched = fnmatch.fnmatch(str(path), pattern)
+            elif isinstance(pattern, re.Pattern):
+                matched = bool(pattern.match(str(path)))
+            else:
+                matched = pattern(path)
+
+            if matched:
+                return True
+        return False
+
+    with sh.cd(tmp_path):
+        all_paths = set(sh.walk(""))
+        included = set(sh.walk("", include=patterns))
+        excluded = set(sh.walk("", exclude=patterns))
+
+    expected = {path for path in all_paths if matches(path)}
+    assert expected
+    assert included == expected
+    assert excluded == {path for path in all_paths - expected if not matches(path.parent)}
+
+
+@parametrize("chunk_size", [param(1), param(2), param(5), param(6)])
+def test_ls__lists_dirs_in_chunks(tmp_path: Path, chunk_size: int):
+    src = Dir(tmp_path, Dir("a", *(File(f"a{i}.txt") for i in range(5))), File("b.txt"))
+    src.mkdir()
+
+    with sh.cd(tmp_path):
+        expected = set(sh.walk(""))
+        with mock.patch.object(sh.path, "SCANDIR_CHUNK_SIZE", chunk_size):
+            contents = set(sh.walk(""))
+
+    assert len(expected) == 7
+    assert contents == expected
+
+
+def test_ls__reuses_compiled_str_filters(tmp_path: Path):
+    src = Dir(tmp_path, File("a.txt"), File("b.log"), File("c.py"))
+    src.mkdir()
+    sh.path._make_glob_fn.cache_clear()
+
+    with mock.patch("fnmatch.translate", wraps=fnmatch.translate) as mocked_translate:
+        for _ in range(3):
+            assert set(sh.ls(tmp_path, include=["*.tx?", "*.lo?"])) == {
+                tmp_path / "a.txt",
+                tmp_path / "b.log",
+            }
+            assert set(sh.ls(tmp_path, exclude="*.p?")) == {tmp_path / "a.txt", tmp_path / "b.log"}
+
+    assert mocked_translate.call_count == 3
+
+
+def test_ls__closes_dir_before_yielding_its_contents(tmp_path: Path):
+    src = Dir(tmp_path, Dir("a", File("a1.txt"), File("a2.txt")), File("b.txt"), File("c.txt"))
+    src.mkdir()
+    open_scanners = []
+    scandir = os.scandir
+
+    class Scanner:
+        def __init__(self, path):
+            self.scanner = scandir(path)
+            open_scanners.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            open_scanners.remove(self)
+            self.scanner.close()
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            return next(self.scanner)
+
+    contents = []
+    with mock.patch("os.scandir", side_effect=Scanner):
+        for path in sh.walk(tmp_path):
+            assert not open_scanners
+            contents.append(path)
+
+    assert len(contents) == 5
+
+
+def test_ls__lists_but_does_not_recurse_into_symlinked_dirs(tmp_path: Path):
+    src = Dir(tmp_path / "src", Dir("a_dir", File("a1.txt")), File("b.txt"))
+    src.mkdir()
+    linked_dir = Dir(tmp_path / "linked", File("l1.txt"))
+    linked_dir.mkdir()
+    (src.path / "link").symlink_to(linked_dir.path)
+
+    with sh.cd(src.path):
+        contents = set(sh.ls("", recursive=True))
+        dirs = set(sh.ls("", recursive=True, only_dirs=True))
+        files = set(sh.ls("", recursive=True, only_files=True))
+
+    assert contents == {Path("a_dir"), Path("a_dir/a1.txt"), Path("b.txt"), Path("link")}
+    assert dirs == {Path("a_dir"), Path("link")}
+    assert files == {Path("a_dir/a1.txt"), Path("b.txt")}
+
+
+@parametrize("workers", [param(1), param(4)])
+def test_ls__walks_dirs_reachable_from_multiple_paths_once(tmp_path: Path, workers: int):
+    src = Dir(tmp_path, Dir("a", File("a1.txt")), Dir("b", File("b1.txt")), Dir("c"))
+    src.mkdir()
+    dir_id = sh.path._dir_id
+
+    def same_dir_id(entry):
+        # Simulate "a" and "b" being the same directory (e.g. one is a bind mount of the other).
+        return (-1, -1) if entry.name in ("a", "b") else dir_id(entry)
+
+    with sh.cd(tmp_path), mock.patch.object(sh.path, "_dir_id", side_effect=same_dir_id):
+        contents = set(sh.walk("", workers=workers, visit_once=True))
+
+    assert {Path("a"), Path("b"), Path("c")} <= contents
+    assert len(contents & {Path("a/a1.txt"), Path("b/b1.txt")}) == 1
+
+
+@parametrize("workers", [param(1), param(4)])
+def test_ls__does_not_stat_dirs_unless_visiting_once(tmp_path: Path, workers: int):
+    src = Dir(tmp_path, Dir("a", File("a1.txt")), Dir("b", File("b1.txt")), Dir("c"))
+    src.mkdir()
+
+    with sh.cd(tmp_path), mock.patch.object(sh.path, "_dir_id") as mocked_dir_id:
+        contents = set(sh.walk("", workers=workers))
+
+    assert not mocked_dir_id.called
+    assert contents == {
+        Path("a"),
+        Path("a/a1.txt"),
+        Path("b"),
+        Path("b/b1.txt"),
+        Path("c"),
+    }
+
+
+@parametrize(
+    "kwargs",
+    [
+        param({}),
+        param({"only_files": True}),
+        param({"only_dirs": True}),
+        param({"include": "*.txt"}),
+        param({"exclude": "*_excluded"}),
+        param({"include": lambda path: path.name.endswith(".txt")}),
+        param({"exclude": lambda path: path.name.endswith("_excluded")}),
+    ],
+)
+def test_ls__walks_with_multiple_workers(tmp_path: Path, kwargs: dict):
+    src = Dir(
+        tmp_path,
+        Dir("a_excluded", File("a1.txt"), Dir("aa", File("aa1.txt"))),
+        Dir("b/bb/bbb", File("b1.txt"), File("b2.log")),
+        Dir("c"),
+        File("1.txt"),
+        File("2.log"),
+    )
+    src.mkdir()
+
+    with sh.cd(tmp_path):
+        expected = set(sh.walk("", **kwargs))
+        contents = list(sh.walk("", workers=4, **kwargs))
+
+    assert expected
+    assert len(contents) == len(expected)
+    assert set(contents) == expected
+
+
+def test_ls__calls_callable_filter_from_worker_threads(tmp_path: Path):
+    src = Dir(tmp_path, Dir("a", File("a1.txt")), Dir("b/bb", File("b1.txt")), File("1.txt"))
+    src.mkdir()
+    filter_threads = set()
+
+    def include(path: Path) -> bool:
+        filter_threads.add(threading.get_ident())
+        return path.suffix == ".txt"
+
+    with sh.cd(tmp_path):
+        contents = set(sh.walk("", include=include, workers=4))
+
+    assert contents == {Path("a/a1.txt"), Path("b/bb/b1.txt"), Path("1.txt")}
+    assert filter_threads
+    assert threading.get_ident() not in filter_threads
+
+
+def test_ls__raises_when_walking_missing_dir_with_multiple_workers(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        list(sh.walk(tmp_path / "missing", workers=2))
+
+
 @parametrize(
     "path, kwargs, expected",
     [
@@ -334,9 +578,36 @@ def test_ls__raises_when_include_is_invalid_type():
     [
         param(sh.lsfiles, {"only_files": True}),
         param(sh.lsdirs, {"only_dirs": True}),
-        param(sh.walk, {"recursive": True, "only_files": False, "only_dirs": False}),
-        param(sh.walkfiles, {"recursive": True, "only_files": True, "only_dirs": False}),
-        param(sh.walkdirs, {"recursive": True, "only_dirs": True, "only_files": False}),
+        param(
+            sh.walk,
+            {
+                "recursive": True,
+                "only_files": False,
+                "only_dirs": False,
+                "workers": 1,
+                "visit_once": False,
+            },
+        ),
+        param(
+            sh.walkfiles,
+            {
+                "recursive": True,
+                "only_files": True,
+                "only_dirs": False,
+                "workers": 1,
+                "visit_once": False,
+            },
+        ),
+        param(
+            sh.walkdirs,
+            {
+                "recursive": True,
+                "only_dirs": True,
+                "only_files": False,
+                "workers": 1,
+                "visit_once": False,
+            },
+        ),
     ],
 )
 def test_ls_aliases(tmp_path: Path, fn: t.Callable, expected_kwargs: dict):
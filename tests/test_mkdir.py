@@ -1,5 +1,6 @@
 from pathlib import Path
 import typing as t
+from unittest import mock
 
 import pytest
 from pytest import param
@@ -17,6 +18,7 @@ parametrize = pytest.mark.parametrize
         param(["a", "a/b", "a/b/c", "d/e/f/g/h"]),
         param([Path("a")]),
         param([Path("a"), Path("a/b"), Path("a/b/c"), Path("d/e/f/g/h")]),
+        param([f"{i}/{j}" for i in range(4) for j in range(4)] + ["0", "1/x/y"], id="many"),
     ],
 )
 def test_mkdir(tmp_path: Path, paths: t.List[t.Union[str, Path]]):
@@ -40,3 +42,23 @@ def test_mkdir__sets_mode(tmp_path: Path):
 def test_mkdir__raises_if_exist_not_ok(tmp_path: Path):
     with pytest.raises(FileExistsError):
         sh.mkdir(tmp_path, exist_ok=False)
+
+
+def test_mkdir__skips_makedirs_when_dir_exists(tmp_path: Path):
+    with mock.patch("os.makedirs") as mocked_makedirs:
+        sh.mkdir(tmp_path)
+
+    assert not mocked_makedirs.called
+
+    with pytest.raises(FileExistsError):
+        sh.mkdir(tmp_path, exist_ok=False)
+
+
+def test_mkdir__creates_duplicate_paths_once(tmp_path: Path):
+    path = tmp_path / "a" / "b"
+
+    with mock.patch("shelmet.filesystem._mkdir", wraps=sh.filesystem._mkdir) as mocked_mkdir:
+        sh.mkdir(path, str(path), path)
+
+    assert path.is_dir()
+    assert mocked_mkdir.call_count == 1
@@ -132,14 +132,14 @@ def test_mv__works_across_file_systems(tmp_path: Path):
     src_file.write()
 
     dst_file = File(tmp_path / "dst.txt")
-    _os_rename = os.rename
+    _os_replace = os.replace
 
-    def mock_os_rename(src, dst):
+    def mock_os_replace(src, dst):
         if str(src) == str(src_file.path) and str(dst) == str(dst_file.path):
             raise OSError(errno.EXDEV, "mock error from move across file systems")
-        return _os_rename(src, dst)
+        return _os_replace(src, dst)
 
-    with mock.patch("os.rename", side_effect=mock_os_rename):
+    with mock.patch("os.replace", side_effect=mock_os_replace):
         sh.mv(src_file.path, dst_file.path)
 
     assert dst_file.path.exists()
@@ -147,6 +147,21 @@ def test_mv__works_across_file_systems(tmp_path: Path):
     assert not src_file.path.exists()
 
 
+def test_mv__removes_temp_file_when_copy_across_file_systems_fails(tmp_path: Path):
+    src_file = File(tmp_path / "src.txt", text="src")
+    src_file.write()
+    dst_file = File(tmp_path / "dst.txt")
+
+    with mock.patch(
+        "os.replace", side_effect=OSError(errno.EXDEV, "mock error from move across file systems")
+    ):
+        with pytest.raises(OSError):
+            sh.mv(src_file.path, dst_file.path)
+
+    assert src_file.path.read_text() == src_file.text
+    assert list(tmp_path.iterdir()) == [src_file.path]
+
+
 def test_mv__raises_when_source_dir_exists_in_destination_and_is_not_empty(tmp_path: Path):
     src_dir = Dir(tmp_path / "src", File("src.txt", text="src"))
     src_dir.mkdir()
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import typing as t
+from unittest import mock
 from uuid import uuid4
 
 import pytest
@@ -88,6 +89,22 @@ def test_read__returns_binary_file_contents(write_bytes: t.Callable[[bytes], Pat
     assert sh.read(test_file, "rb") == content
 
 
+@parametrize(
+    "open_kwargs",
+    [
+        param({}),
+        param({"buffering": -1}),
+        param({"buffering": 1024}),
+    ],
+)
+def test_read__returns_large_binary_file_contents(
+    write_bytes: t.Callable[[bytes], Path], open_kwargs: dict
+):
+    content = os.urandom(1024 * 1024 + 1)
+    test_file = write_bytes(content)
+    assert sh.read(test_file, "rb", **open_kwargs) == content
+
+
 def test_read__accepts_valid_mode(tmp_path: Path, valid_read_only_mode):
     test_file = tmp_path / "test_file"
     test_file.touch()
@@ -114,6 +131,34 @@ def test_readbytes__returns_binary_file_contents(write_bytes: t.Callable[[bytes]
     assert sh.readbytes(test_file) == content
 
 
+def test_readmmap__returns_binary_file_contents(write_bytes: t.Callable[[bytes], Path]):
+    content = os.urandom(1024 * 1024 + 1)
+    test_file = write_bytes(content)
+
+    with sh.readmmap(test_file) as mm:
+        assert len(mm) == len(content)
+        assert mm[:] == content
+        assert mm.find(content[-10:]) == len(content) - 10
+
+    assert mm.closed
+
+
+def test_readmmap__is_read_only(write_bytes: t.Callable[[bytes], Path]):
+    test_file = write_bytes(b"some data")
+
+    with sh.readmmap(test_file) as mm:
+        with pytest.raises(TypeError):
+            mm[0] = 0
+
+    assert test_file.read_bytes() == b"some data"
+
+
+def test_readmmap__raises_when_file_empty(write_bytes: t.Callable[[bytes], Path]):
+    test_file = write_bytes(b"")
+    with pytest.raises(ValueError):
+        sh.readmmap(test_file)
+
+
 @parametrize(
     "chunks, size, sep",
     [
@@ -175,6 +220,66 @@ def test_readchunks__yields_binary_chunks_by_size(
         assert chunk.decode() == chunks[i]
 
 
+@parametrize(
+    "content, size, sep",
+    [
+        param("|a||bb|ccc|", 1, "|"),
+        param("|a||bb|ccc|", 3, "|"),
+        param("|a||bb|ccc|dddd", 2, "|"),
+        param("xyaxyybxyxyc", 1, "xy"),
+        param("xyaxyybxyxyc", 3, "xy"),
+        param("xxyaxxyybxxyxyc", 2, "xxy"),
+        param("abc", 2, "|"),
+        param("", 2, "|"),
+        param("a" * 1000 + "xy" + "b" * 1000 + "xxy", 7, "xy"),
+    ],
+)
+def test_readchunks__yields_all_chunks_split_by_sep(
+    write_text: t.Callable[[str], Path], content: str, size: int, sep: str
+):
+    test_file = write_text(content)
+    expected = content.split(sep)
+    if not expected[-1]:
+        expected.pop()
+
+    assert list(sh.readchunks(test_file, size=size, sep=sep)) == expected
+    assert list(sh.readchunks(test_file, "rb", size=size, sep=sep.encode())) == [
+        chunk.encode() for chunk in expected
+    ]
+
+
+def test_readchunks__yields_default_chunk_size(write_bytes: t.Callable[[bytes], Path]):
+    content = os.urandom(sh.fileio.DEFAULT_CHUNK_SIZE * 2 + 1)
+    test_file = write_bytes(content)
+    chunks = list(sh.readchunks(test_file, "rb"))
+
+    assert [len(chunk) for chunk in chunks] == [
+        sh.fileio.DEFAULT_CHUNK_SIZE,
+        sh.fileio.DEFAULT_CHUNK_SIZE,
+        1,
+    ]
+    assert b"".join(chunks) == content
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="requires os.posix_fadvise")
+@parametrize(
+    "read_fn",
+    [
+        param(lambda file: list(sh.readchunks(file)), id="readchunks"),
+        param(lambda file: list(sh.readchunks(file, sep="|")), id="readchunks_sep"),
+        param(lambda file: list(sh.readlines(file)), id="readlines"),
+    ],
+)
+def test_read__advises_sequential_access(write_text: t.Callable[[str], Path], read_fn: t.Callable):
+    test_file = write_text("a|b|c")
+
+    with mock.patch("os.posix_fadvise") as mocked_posix_fadvise:
+        read_fn(test_file)
+
+    assert mocked_posix_fadvise.call_count == 1
+    assert mocked_posix_fadvise.call_args[0][1:] == (0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
 def test_readchunks__raises_when_mode_invalid(
     write_text: t.Callable[[str], Path], invalid_read_only_mode: str
 ):
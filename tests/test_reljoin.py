@@ -26,6 +26,9 @@ parametrize = pytest.mark.parametrize
         param([Path("/a"), Path("b"), Path("c/d")], "/a/b/c/d"),
         param(["a", Path("b"), "c/d"], "a/b/c/d"),
         param([Path("a"), "b", Path("c/d")], "a/b/c/d"),
+        param(["", "a", "", "b"], "a/b"),
+        param(["a//b/", "./c", "d/.."], "a/b/c"),
+        param(["//a", "b"], "//a/b"),
     ],
 )
 def test_reljoin(paths: t.Sequence[t.Union[Path, str]], expected: str):
@@ -47,6 +47,47 @@ def test_rm(tmp_path: Path, sources: t.Sequence[File]):
         assert not src.path.exists()
 
 
+def test_rm__removes_symlinks_without_their_targets(tmp_path: Path):
+    target_dir = Dir(tmp_path / "target", File("1.txt", text="1"))
+    target_dir.mkdir()
+    target_file = tmp_path / "target.txt"
+    target_file.write_text("target")
+    dir_link = tmp_path / "dir_link"
+    dir_link.symlink_to(target_dir.path)
+    file_link = tmp_path / "file_link"
+    file_link.symlink_to(target_file)
+
+    sh.rm(dir_link, file_link)
+
+    assert not dir_link.is_symlink()
+    assert not file_link.is_symlink()
+    assert (target_dir.path / "1.txt").read_text() == "1"
+    assert target_file.read_text() == "target"
+
+
+@parametrize(
+    "rm_fn, paths",
+    [
+        param(sh.rm, ["a", "a/b", "a/b/c", "a/b/c/1.txt", "a-b", "ab", "d", "d/e", "d/e/f"]),
+        param(sh.rmdir, ["a", "a/b", "a/b/c", "a-b", "ab", "d", "d/e", "d/e/f", "a"]),
+        param(sh.rmfile, [f"{i}/{j}.txt" for i in range(4) for j in range(4)]),
+    ],
+)
+@parametrize("workers", [param(1), param(4)])
+def test_rm__removes_many_nested_paths(
+    tmp_path: Path, rm_fn: t.Callable, paths: t.List[str], workers: int
+):
+    files = [File(f"{path}/1.txt", text=path) for path in paths if not path.endswith(".txt")]
+    files += [File(path, text=path) for path in paths if path.endswith(".txt")]
+    Dir(tmp_path, *files).mkdir()
+    targets = [tmp_path / path for path in paths]
+
+    rm_fn(*targets, workers=workers)
+
+    for target in targets:
+        assert not target.exists()
+
+
 @parametrize(
     "sources",
     [
@@ -116,6 +157,34 @@ def test_rmfile__raises_on_dir(tmp_path: Path):
         sh.rmfile(path)
 
 
+def test_rmfile__stops_at_first_error(tmp_path: Path):
+    files = [tmp_path / f"{i}.txt" for i in range(10)]
+    for file in files:
+        file.touch()
+    bad_path = tmp_path / "dir"
+    bad_path.mkdir()
+
+    with pytest.raises(OSError):
+        sh.rmfile(*files[:5], bad_path, *files[5:])
+
+    assert not any(file.exists() for file in files[:5])
+    assert all(file.exists() for file in files[5:])
+
+
+def test_rmfile__processes_every_path_before_raising_when_concurrent(tmp_path: Path):
+    files = [tmp_path / f"{i}.txt" for i in range(10)]
+    for file in files:
+        file.touch()
+    bad_path = tmp_path / "dir"
+    bad_path.mkdir()
+
+    with pytest.raises(OSError):
+        sh.rmfile(*files[:5], bad_path, *files[5:], workers=4)
+
+    assert not any(file.exists() for file in files)
+    assert bad_path.exists()
+
+
 @parametrize(
     "rm_fn",
     [
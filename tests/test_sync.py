@@ -1,3 +1,4 @@
+import errno
 from pathlib import Path
 from unittest import mock
 
@@ -22,6 +23,38 @@ def test_dirsync(tmp_path: Path):
     assert mocked_os_fsync.called
 
 
+def test_dirsync__skips_devices_that_do_not_support_it(tmp_path: Path):
+    path = tmp_path / "test"
+    path.mkdir()
+    dev = path.stat().st_dev
+
+    with mock.patch(
+        "shelmet.filesystem._dirsync_unsupported_devices", set()
+    ) as unsupported_devices:
+        with mock.patch(
+            "shelmet.filesystem.fsync", side_effect=OSError(errno.EINVAL, "mock error")
+        ) as mocked_fsync:
+            sh.dirsync(path)
+            sh.dirsync(path)
+
+    assert mocked_fsync.call_count == 1
+    assert unsupported_devices == {dev}
+
+
+def test_dirsync__raises_other_errors(tmp_path: Path):
+    path = tmp_path / "test"
+    path.mkdir()
+
+    with mock.patch(
+        "shelmet.filesystem._dirsync_unsupported_devices", set()
+    ) as unsupported_devices:
+        with mock.patch("shelmet.filesystem.fsync", side_effect=OSError(errno.EIO, "mock error")):
+            with pytest.raises(OSError):
+                sh.dirsync(path)
+
+    assert not unsupported_devices
+
+
 def test_fsync__syncs_on_file_object(tmp_path: Path):
     file = tmp_path / "test.txt"
 
@@ -49,6 +82,37 @@ def test_fsync__syncs_on_fileno(tmp_path: Path):
     assert mock_os_fsync.call_args[0][0] == fileno
 
 
+def test_fsync__syncs_data_only(tmp_path: Path):
+    file = tmp_path / "test.txt"
+    file.write_text("test")
+
+    with file.open() as fp:
+        fileno = fp.fileno()
+        with mock.patch("os.fdatasync") as mock_os_fdatasync, mock.patch(
+            "os.fsync"
+        ) as mock_os_fsync:
+            sh.fsync(fileno, data_only=True)
+
+    assert mock_os_fdatasync.called
+    assert mock_os_fdatasync.call_args[0][0] == fileno
+    assert not mock_os_fsync.called
+
+
+def test_fsync__syncs_data_and_metadata_by_default(tmp_path: Path):
+    file = tmp_path / "test.txt"
+    file.write_text("test")
+
+    with file.open() as fp:
+        fileno = fp.fileno()
+        with mock.patch("os.fdatasync") as mock_os_fdatasync, mock.patch(
+            "os.fsync"
+        ) as mock_os_fsync:
+            sh.fsync(fileno)
+
+    assert not mock_os_fdatasync.called
+    assert mock_os_fsync.called
+
+
 @parametrize(
     "arg",
     [
@@ -57,6 +121,7 @@ def test_fsync__syncs_on_fileno(tmp_path: Path):
         param([]),
         param({}),
         param(set()),
+        param(mock.Mock(spec=["fileno"]), id="no_flush"),
     ],
 )
 def test_fsync__raises_on_invalid_arg_type(arg):
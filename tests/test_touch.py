@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import typing as t
 
@@ -15,6 +16,7 @@ parametrize = pytest.mark.parametrize
     [
         param(["a"]),
         param(["a", "b", "c/d/e"]),
+        param([f"{i}/{j}" for i in range(4) for j in range(4)], id="many"),
     ],
 )
 def test_touch(tmp_path: Path, paths: t.List[str]):
@@ -22,3 +24,21 @@ def test_touch(tmp_path: Path, paths: t.List[str]):
     sh.touch(*targets)
     for path in targets:
         assert path.is_file()
+
+
+def test_touch__updates_existing_file_times(tmp_path: Path):
+    path = tmp_path / "a"
+    path.write_text("a")
+    os.utime(path, (1000000000, 1000000000))
+
+    sh.touch(path)
+
+    assert path.stat().st_mtime > 1000000000
+    assert path.read_text() == "a"
+
+
+def test_touch__creates_file_in_current_dir(tmp_path: Path):
+    with sh.cd(tmp_path):
+        sh.touch("a")
+
+    assert (tmp_path / "a").is_file()
@@ -1,3 +1,5 @@
+import io
+import os
 from pathlib import Path
 import typing as t
 from unittest import mock
@@ -230,6 +232,39 @@ def test_writetext(tmp_path: Path, mode: str, contents: str):
     assert contents == actual_contents
 
 
+@parametrize(
+    "mode, contents, open_kwargs",
+    [
+        param("w", "a\nb\nc\n", {}),
+        param("w", "a\nb\nc\n", {"newline": ""}),
+        param("w", "a\nb\nc\n", {"newline": "\r\n"}),
+        param("w", "a\nb\nc\n", {"newline": "\r"}),
+        param("w", "á\nb\nç\n", {"encoding": "utf-16"}),
+        param("w", "á\nb\nç\n", {"encoding": "utf-8-sig"}),
+        param("w", "á\nb\nç\n", {"encoding": "ascii", "errors": "replace"}),
+        param("x", "á\nb\nç\n", {"encoding": "latin-1", "newline": "\r\n"}),
+        param("a", "á\nb\nç\n", {"encoding": "utf-16"}),
+    ],
+)
+def test_writetext__writes_same_contents_as_open(
+    tmp_path: Path, mode: str, contents: str, open_kwargs: dict
+):
+    file = tmp_path / "test_file"
+    expected_file = tmp_path / "expected_file"
+
+    with open(expected_file, mode, **open_kwargs) as fp:
+        fp.write(contents)
+
+    sh.writetext(file, contents, mode, **open_kwargs)
+    assert file.read_bytes() == expected_file.read_bytes()
+
+    if mode == "w":
+        sh.writetext(file, contents, mode, atomic=True, **open_kwargs)
+        with open(expected_file, mode, **open_kwargs) as fp:
+            fp.write(contents)
+        assert file.read_bytes() == expected_file.read_bytes()
+
+
 def test_writetext__accepts_valid_mode(tmp_path: Path, valid_write_only_text_mode: str):
     sh.write(tmp_path / "test_file", "", valid_write_only_text_mode)
 
@@ -240,6 +275,102 @@ def test_writetext__raises_when_mode_invalid(tmp_path: Path, invalid_write_only_
         sh.writetext(file, "", invalid_write_only_text_mode)
 
 
+@parametrize(
+    "mode, atomic",
+    [
+        param("wb", False),
+        param("wb", True),
+        param("xb", True),
+        param("ab", False),
+    ],
+)
+def test_write__writes_large_binary_contents_unbuffered(tmp_path: Path, mode: str, atomic: bool):
+    file = tmp_path / "test_file"
+    contents = os.urandom(sh.fileio.WRITE_UNBUFFERED_MIN_SIZE + 1)
+
+    with mock.patch.object(sh.fileio, "_writeall", wraps=sh.fileio._writeall) as mocked_writeall:
+        sh.write(file, contents, mode, atomic=atomic)
+
+    assert mocked_writeall.called
+    assert isinstance(mocked_writeall.call_args[0][0], io.FileIO)
+    assert file.read_bytes() == contents
+
+
+def test_write__retries_partial_unbuffered_writes():
+    class PartialWriter(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data += b[:1000]
+            return len(b[:1000])
+
+    fp = PartialWriter()
+    contents = os.urandom(10001)
+    sh.fileio._writeall(fp, contents)
+
+    assert fp.data == contents
+
+
+@parametrize(
+    "mode, contents, opts",
+    [
+        param("w", "abcd", {}),
+        param("w", "abcd", {"atomic": True}),
+        param("x", "abcd", {"atomic": True, "workers": 2}),
+        param("wb", b"abcd", {}),
+        param("wb", b"abcd", {"atomic": True, "workers": 1}),
+        param("xb", b"abcd", {"atomic": True}),
+    ],
+)
+def test_writemany(
+    tmp_path: Path, mode: str, contents: t.Union[str, bytes], opts: t.Dict[str, t.Any]
+):
+    files = [tmp_path / "a" / f"{i}.txt" for i in range(10)] + [
+        tmp_path / "b" / f"{i}.txt" for i in range(10)
+    ]
+    sh.mkdir(tmp_path / "a", tmp_path / "b")
+    sh.writemany(((file, contents) for file in files), mode, **opts)
+
+    for file in files:
+        actual_contents = file.read_bytes()
+        if isinstance(contents, str):
+            actual_contents = actual_contents.decode()  # type: ignore
+        assert contents == actual_contents
+
+
+def test_writemany__syncs_each_dir_once_when_atomic(tmp_path: Path):
+    files = [tmp_path / "a" / f"{i}.txt" for i in range(10)] + [
+        tmp_path / "b" / f"{i}.txt" for i in range(10)
+    ]
+
+    with mock.patch("shelmet.fileio.dirsync") as mocked_dirsync:
+        sh.writemany([(file, "test") for file in files], atomic=True)
+
+    assert mocked_dirsync.call_args_list == [
+        mock.call(str(tmp_path / "a")),
+        mock.call(str(tmp_path / "b")),
+    ]
+
+
+def test_writemany__raises_write_error(tmp_path: Path):
+    file = tmp_path / "test_file"
+    file.write_text("")
+
+    with pytest.raises(FileExistsError):
+        sh.writemany([(tmp_path / "other_file", "test"), (file, "test")], "x")
+
+    assert (tmp_path / "other_file").read_text() == "test"
+
+
+def test_writemany__raises_when_mode_invalid(tmp_path: Path, invalid_write_only_mode: str):
+    with pytest.raises(ValueError):
+        sh.writemany([(tmp_path / "test_file", "")], invalid_write_only_mode)
+
+
 @parametrize(
     "mode, items",
     [
@@ -272,6 +403,42 @@ def test_writelines(tmp_path: Path, mode: str, items: t.List[t.AnyStr]):
         assert items[i] == line.strip()
 
 
+@parametrize(
+    "items, expected",
+    [
+        param([], b""),
+        param(["a"], b"a\n"),
+        param(["a", "b", "c"], b"a\nb\nc\n"),
+        param(("a", "b", "c"), b"a\nb\nc\n"),
+        param(iter(["a", "b", "c"]), b"a\nb\nc\n"),
+        param((item for item in ["a", "b", "c"]), b"a\nb\nc\n"),
+    ],
+)
+def test_writelines__writes_sized_and_unsized_items(
+    tmp_path: Path, items: t.Iterable[str], expected: bytes
+):
+    file = tmp_path / "test_file"
+    sh.writelines(file, items, newline="")
+    assert file.read_bytes() == expected
+
+
+@parametrize(
+    "items",
+    [
+        param([b"a", b"b", b"c", b"d", b"e"]),
+        param(iter([b"a", b"b", b"c", b"d", b"e"])),
+    ],
+)
+def test_writelines__writes_items_in_batches(
+    tmp_path: Path, mock_atomicfile: mock.MagicMock, items: t.Iterable[bytes]
+):
+    with mock.patch.object(sh.fileio, "WRITELINES_BATCH_SIZE", 2):
+        sh.writelines(tmp_path / "test_file", items, "wb", ending=b"|", atomic=True)
+
+    fp = mock_atomicfile.return_value.__enter__.return_value
+    assert fp.write.call_args_list == [mock.call(b"a|b|"), mock.call(b"c|d|"), mock.call(b"e|")]
+
+
 def test_writelines__accepts_valid_mode(tmp_path: Path, valid_write_only_mode: str):
     contents: t.Union[str, bytes] = b"" if "b" in valid_write_only_mode else ""
     sh.writelines(tmp_path / "test_file", [contents], valid_write_only_mode)  # type: ignore
@@ -337,8 +504,8 @@ def test_writelines__can_atomically_create_file(
 
     args, kwargs = mock_atomicfile.call_args
     with mock_atomicfile(*args, **kwargs) as fp:
-        assert fp.writelines.called
-        lines = [line.strip() for line in fp.writelines.call_args[0][0]]
+        assert fp.write.called
+        lines = fp.write.call_args[0][0].splitlines()
         assert items == lines
 
 
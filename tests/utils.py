@@ -124,7 +124,12 @@ def patch_os_fsync() -> t.Iterator[mock.MagicMock]:
         patched_os_fsync = mock.patch("os.fsync")
 
     with patched_os_fsync as mocked_os_fsync:
-        yield mocked_os_fsync
+        if USES_FCNTL_FULLSYNC:
+            yield mocked_os_fsync
+        else:
+            # Data-only syncs are counted as syncs too.
+            with mock.patch("os.fdatasync", mocked_os_fsync):
+                yield mocked_os_fsync
 
 
 def is_same_file(file1: Path, file2: Path) -> bool: